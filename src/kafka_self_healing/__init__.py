@@ -20,26 +20,29 @@ __all__ = [
     "__description__",
 ]
 
-# Import main components for easy access
-try:
-    from .main import SelfHealingSystem
-    from .config import ConfigurationManager
-    from .monitoring import MonitoringService
-    from .recovery import RecoveryEngine
-    from .notification import NotificationService
-    from .models import NodeConfig, NodeStatus, RecoveryResult
-    
-    __all__.extend([
-        "SelfHealingSystem",
-        "ConfigurationManager", 
-        "MonitoringService",
-        "RecoveryEngine",
-        "NotificationService",
-        "NodeConfig",
-        "NodeStatus", 
-        "RecoveryResult",
-    ])
-    
-except ImportError:
-    # Handle import errors gracefully during package installation
-    pass
\ No newline at end of file
+# Main components, imported on first access so that loading a single submodule
+# (e.g. ``kafka_self_healing.models``) does not pull in the whole application
+_LAZY_EXPORTS = {
+    "ConfigurationManager": ".config",
+    "MonitoringService": ".monitoring",
+    "RecoveryEngine": ".recovery",
+    "NotificationService": ".notification",
+    "NodeConfig": ".models",
+    "NodeStatus": ".models",
+    "RecoveryResult": ".models",
+}
+
+__all__.extend(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    """Resolve package-level exports lazily."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
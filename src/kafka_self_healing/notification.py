@@ -5,37 +5,84 @@ This module provides the core notification framework including:
 - NotificationService: Main notification orchestrator
 - NotificationTemplate: Email content generation
 - DeliveryQueue: Notification retry and queuing
+- SMTPConnectionPool: Reusable SMTP sessions for email delivery
 - NotificationResult: Delivery result tracking
 """
 
 import smtplib
 import ssl
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.message import Message
+from email.policy import compat32
 from email.utils import formatdate
-from typing import List, Dict, Any, Optional, Callable, Union
+from typing import List, Dict, Any, Optional, Callable, Union, Tuple, Deque
+import functools
+import itertools
 import threading
 import time
 import queue
 import logging
+import sys
 from string import Template
 
 from .models import NodeConfig, RecoveryResult, NotificationConfig
 from .exceptions import NotificationError
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Fixed test message bodies; only the notification timestamp varies per send
+_TEST_NOTIFICATION_TEXT = (
+    "This is a test notification from the Kafka Self-Healing System.\n\n"
+    "If you receive this message, notifications are working correctly."
+)
+_TEST_NOTIFICATION_HTML = """
+<html>
+<body>
+    <h2>Test Notification</h2>
+    <p>This is a test notification from the Kafka Self-Healing System.</p>
+    <p>If you receive this message, notifications are working correctly.</p>
+    <p><strong>Timestamp:</strong> %s</p>
+</body>
+</html>
+"""
+_TEST_EMAIL_TEXT = (
+    "This is a test email from the Kafka Self-Healing System.\n\n"
+    "If you receive this message, email notifications are configured correctly."
+)
+_TEST_EMAIL_HTML = """
+<html>
+<body>
+    <h2>Test Email</h2>
+    <p>This is a test email from the Kafka Self-Healing System.</p>
+    <p>If you receive this message, email notifications are configured correctly.</p>
+</body>
+</html>
+"""
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class NotificationResult:
     """Result of a notification delivery attempt."""
     notification_id: str
     recipient: str
-    delivery_time: datetime
     success: bool
     error_message: Optional[str] = None
     retry_count: int = 0
+    # Wall-clock nanoseconds; a datetime is only built when delivery_time is read
+    delivery_time_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def delivery_time(self) -> datetime:
+        """Delivery time as a local datetime."""
+        return datetime.fromtimestamp(self.delivery_time_ns / 1e9)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -49,7 +96,7 @@ class NotificationResult:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class NotificationMessage:
     """A notification message to be delivered."""
     notification_id: str
@@ -497,11 +544,17 @@ Generated at: $generated_time
 class DeliveryQueue:
     """Queue for managing notification delivery with retry logic."""
 
-    def __init__(self, max_queue_size: int = 1000):
-        """Initialize delivery queue."""
+    def __init__(self, max_queue_size: int = 1000, num_workers: int = 1):
+        """Initialize delivery queue.
+        
+        With num_workers > 1 several messages are delivered concurrently and
+        may complete out of enqueue order.
+        """
         self.queue = queue.Queue(maxsize=max_queue_size)
         self.retry_queue = queue.Queue(maxsize=max_queue_size)
+        self.num_workers = num_workers
         self.running = False
+        self.worker_threads: List[threading.Thread] = []
         self.worker_thread = None
         self.retry_thread = None
         self.logger = logging.getLogger(__name__)
@@ -512,17 +565,21 @@ class DeliveryQueue:
             return
         
         self.running = True
-        self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self.worker_threads = [
+            threading.Thread(target=self._worker_loop, daemon=True) for _ in range(self.num_workers)
+        ]
+        self.worker_thread = self.worker_threads[0]
         self.retry_thread = threading.Thread(target=self._retry_loop, daemon=True)
-        self.worker_thread.start()
+        for worker in self.worker_threads:
+            worker.start()
         self.retry_thread.start()
-        self.logger.info("Delivery queue started")
+        self.logger.info(f"Delivery queue started with {self.num_workers} worker(s)")
 
     def stop(self) -> None:
         """Stop the delivery queue worker threads."""
         self.running = False
-        if self.worker_thread:
-            self.worker_thread.join(timeout=5)
+        for worker in self.worker_threads:
+            worker.join(timeout=5)
         if self.retry_thread:
             self.retry_thread.join(timeout=5)
         self.logger.info("Delivery queue stopped")
@@ -579,6 +636,11 @@ class DeliveryQueue:
         # This method will be overridden by NotificationService
         self.logger.debug(f"Processing notification {message.notification_id}")
 
+    @property
+    def approx_size(self) -> int:
+        """Delivery queue size read without taking the queue lock; may be stale under concurrency."""
+        return self.queue._qsize()
+
     def get_queue_sizes(self) -> Dict[str, int]:
         """Get current queue sizes for monitoring."""
         return {
@@ -590,16 +652,31 @@ class DeliveryQueue:
 class NotificationService:
     """Main notification service orchestrator."""
 
-    def __init__(self, config: NotificationConfig, template_engine: Optional[NotificationTemplate] = None):
-        """Initialize notification service."""
+    # Once more than a third of the recent deliveries failed (over at least 30),
+    # pending notifications are failed immediately rather than attempted
+    FAIL_FAST_WINDOW = 100
+    FAIL_FAST_MIN_RESULTS = 30
+    FAIL_FAST_RATIO = 1 / 3
+    # Queued messages identical to the one being delivered are merged into it
+    # once this many are waiting
+    COALESCE_QUEUE_DEPTH = 10
+
+    def __init__(self, config: NotificationConfig, template_engine: Optional[NotificationTemplate] = None,
+                 delivery_workers: int = 1):
+        """Initialize notification service.
+        
+        delivery_workers defaults to 1 so alerts for a node are delivered in
+        the order they were raised.
+        """
         self.config = config
         self.template_engine = template_engine or NotificationTemplate()
-        self.delivery_queue = DeliveryQueue()
+        self.delivery_queue = DeliveryQueue(num_workers=delivery_workers)
         self.notifiers: Dict[str, 'Notifier'] = {}
-        self.delivery_callbacks: List[Callable[[NotificationResult], None]] = []
+        # Rebuilt on registration so delivery threads iterate a stable tuple without locking
+        self.delivery_callbacks: Tuple[Callable[[NotificationResult], None], ...] = ()
         self.logger = logging.getLogger(__name__)
-        self._notification_counter = 0
-        self._counter_lock = threading.Lock()
+        # next() on a count is atomic, so IDs need no lock
+        self._notification_counter = itertools.count(1)
         
         # Delivery tracking
         self._delivery_stats = {
@@ -610,6 +687,7 @@ class NotificationService:
             'notifier_stats': {}
         }
         self._stats_lock = threading.Lock()
+        self._recent_outcomes: Deque[bool] = deque(maxlen=self.FAIL_FAST_WINDOW)
         
         # Override delivery queue's message processing
         self.delivery_queue._process_message = self._process_delivery_message
@@ -620,8 +698,13 @@ class NotificationService:
         self.logger.info("Notification service started")
 
     def stop(self) -> None:
-        """Stop the notification service."""
+        """Stop the notification service and release notifier resources."""
         self.delivery_queue.stop()
+        for notifier_type, notifier in self.notifiers.items():
+            try:
+                notifier.close()
+            except Exception as e:
+                self.logger.error(f"Error closing notifier {notifier_type}: {e}")
         self.logger.info("Notification service stopped")
 
     def register_notifier(self, notifier_type: str, notifier: 'Notifier') -> None:
@@ -630,8 +713,8 @@ class NotificationService:
         self.logger.info(f"Registered notifier: {notifier_type}")
 
     def register_delivery_callback(self, callback: Callable[[NotificationResult], None]) -> None:
-        """Register a callback for delivery results."""
-        self.delivery_callbacks.append(callback)
+        """Register a callback for delivery results, e.g. a bound list.append."""
+        self.delivery_callbacks = self.delivery_callbacks + (callback,)
 
     def send_failure_alert(self, node: NodeConfig, recovery_history: List[RecoveryResult],
                           error_message: str, last_success_time: Optional[datetime] = None,
@@ -711,12 +794,35 @@ class NotificationService:
 
     def _generate_notification_id(self) -> str:
         """Generate unique notification ID."""
-        with self._counter_lock:
-            self._notification_counter += 1
-            return f"notif_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{self._notification_counter:04d}"
+        return f"notif_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{next(self._notification_counter):04d}"
 
     def _process_delivery_message(self, message: NotificationMessage) -> None:
         """Process a notification message from the delivery queue."""
+        delivery, absorbed = self._coalesce_pending(message)
+        delivery_successful = self._deliver(delivery, message)
+        
+        # Each absorbed notification gets its own result, and is retried on its own if the merged delivery failed
+        for other in absorbed:
+            self._notify_delivery_result(NotificationResult(
+                notification_id=other.notification_id,
+                recipient="all",
+                success=delivery_successful,
+                error_message=None if delivery_successful else
+                f"Coalesced delivery {message.notification_id} failed",
+                retry_count=other.retry_count
+            ))
+            if not delivery_successful:
+                self._handle_delivery_failure(other, f"Coalesced delivery {message.notification_id} failed")
+        
+        self._record_delivery_outcome(delivery_successful)
+
+    def _deliver(self, delivery: NotificationMessage, message: NotificationMessage) -> bool:
+        """Attempt one delivery of a message via the registered notifiers.
+        
+        delivery is what gets sent: message itself, or message merged with
+        identical queued notifications. Failures are retried as message alone.
+        Returns True if any notifier delivered it.
+        """
         self.logger.debug(f"Processing notification {message.notification_id} (attempt {message.retry_count + 1})")
         
         # Track delivery attempts
@@ -730,7 +836,6 @@ class NotificationService:
             error_result = NotificationResult(
                 notification_id=message.notification_id,
                 recipient="unknown",
-                delivery_time=datetime.now(),
                 success=False,
                 error_message="No notifiers available",
                 retry_count=message.retry_count
@@ -738,7 +843,7 @@ class NotificationService:
             all_results.append(error_result)
             self._notify_delivery_result(error_result)
             self._handle_delivery_failure(message, "No notifiers available")
-            return
+            return False
         
         # Try each registered notifier
         for notifier_type, notifier in self.notifiers.items():
@@ -752,21 +857,21 @@ class NotificationService:
                 
                 if isinstance(notifier, EmailNotifier):
                     # EmailNotifier returns a list of results
-                    results = notifier.send(message)
+                    results = notifier.send(delivery)
                     all_results.extend(results)
                     
                     # Check if at least one recipient succeeded
-                    successful_deliveries = [r for r in results if r.success]
-                    if successful_deliveries:
+                    delivered_count = sum(1 for r in results if r.success)
+                    if delivered_count:
                         delivery_successful = True
-                        self.logger.info(f"Successfully delivered notification {message.notification_id} to {len(successful_deliveries)} recipients via {notifier_type}")
+                        self.logger.info(f"Successfully delivered notification {message.notification_id} to {delivered_count} recipients via {notifier_type}")
                     
                     # Notify callbacks for all results
                     for result in results:
                         self._notify_delivery_result(result)
                 else:
                     # Other notifiers return a single result
-                    result = notifier.send(message)
+                    result = notifier.send(delivery)
                     all_results.append(result)
                     self._notify_delivery_result(result)
                     
@@ -786,7 +891,6 @@ class NotificationService:
                 error_result = NotificationResult(
                     notification_id=message.notification_id,
                     recipient="unknown",
-                    delivery_time=datetime.now(),
                     success=False,
                     error_message=error_msg,
                     retry_count=message.retry_count
@@ -799,6 +903,83 @@ class NotificationService:
             self.logger.info(f"Notification {message.notification_id} delivered successfully after {message.retry_count + 1} attempts")
         else:
             self._handle_delivery_failure(message, f"All notifiers failed. Results: {[r.error_message for r in all_results if not r.success]}")
+        
+        return delivery_successful
+
+    def _coalesce_pending(self, message: NotificationMessage) -> Tuple[NotificationMessage, List[NotificationMessage]]:
+        """Merge queued messages with the same content into one message for all their recipients.
+        
+        Returns the message to deliver and the queued messages absorbed into it.
+        """
+        pending = self.delivery_queue.queue
+        if self.delivery_queue.approx_size < self.COALESCE_QUEUE_DEPTH:
+            return message, []
+        
+        key = self._content_key(message)
+        with pending.mutex:
+            merged = [m for m in pending.queue if self._content_key(m) == key]
+            if not merged:
+                return message, []
+            remaining = [m for m in pending.queue if self._content_key(m) != key]
+            pending.queue.clear()
+            pending.queue.extend(remaining)
+            pending.not_full.notify(len(merged))
+        
+        # task_done takes the queue mutex itself
+        for _ in merged:
+            pending.task_done()
+        
+        recipients = list(message.recipients)
+        for other in merged:
+            recipients.extend(r for r in other.recipients if r not in recipients)
+        
+        self.logger.info(f"Coalesced {len(merged)} identical notifications into {message.notification_id}: "
+                         f"{[m.notification_id for m in merged]}")
+        return replace(message, recipients=recipients), merged
+
+    @staticmethod
+    def _content_key(message: NotificationMessage) -> Tuple[str, str, str, Optional[str]]:
+        """Key identifying messages that render to the same email."""
+        return (message.notification_type, message.subject, message.body_text, message.body_html)
+
+    def _record_delivery_outcome(self, delivered: bool) -> None:
+        """Track a delivery attempt and abort pending messages if too many recent attempts failed."""
+        with self._stats_lock:
+            self._recent_outcomes.append(delivered)
+            attempts = len(self._recent_outcomes)
+            failures = attempts - sum(self._recent_outcomes)
+            abort = (attempts >= self.FAIL_FAST_MIN_RESULTS and
+                     failures / attempts > self.FAIL_FAST_RATIO)
+            if abort:
+                # Give deliveries after the abort a fresh window
+                self._recent_outcomes.clear()
+        
+        if abort:
+            self._abort_pending(failures, attempts)
+
+    def _abort_pending(self, failures: int, attempts: int) -> None:
+        """Fail all queued notifications without attempting delivery."""
+        error_msg = "Batch aborted: failure rate exceeded threshold"
+        aborted = 0
+        
+        while True:
+            try:
+                message = self.delivery_queue.queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            self._notify_delivery_result(NotificationResult(
+                notification_id=message.notification_id,
+                recipient="all",
+                success=False,
+                error_message=error_msg,
+                retry_count=message.retry_count
+            ))
+            self.delivery_queue.queue.task_done()
+            aborted += 1
+        
+        self.logger.error(f"{failures} of the last {attempts} deliveries failed; "
+                          f"aborted {aborted} pending notifications")
 
     def _handle_delivery_failure(self, message: NotificationMessage, error_summary: str) -> None:
         """Handle failed notification delivery."""
@@ -829,7 +1010,6 @@ class NotificationService:
             final_result = NotificationResult(
                 notification_id=message.notification_id,
                 recipient="all",
-                delivery_time=datetime.now(),
                 success=False,
                 error_message=f"Max retries exceeded: {error_summary}",
                 retry_count=message.retry_count
@@ -847,6 +1027,21 @@ class NotificationService:
             if hasattr(self, '_test_mode_max_delay'):
                 delattr(self, '_test_mode_max_delay')
 
+    def _reset_for_test(self) -> None:
+        """Clear notifiers, callbacks, pending messages and statistics so the service can be reused."""
+        self.notifiers.clear()
+        self.delivery_callbacks = ()
+        
+        for pending in (self.delivery_queue.queue, self.delivery_queue.retry_queue):
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+                pending.task_done()
+        
+        self.reset_delivery_statistics()
+
     def _notify_delivery_result(self, result: NotificationResult) -> None:
         """Notify registered callbacks of delivery results and update statistics."""
         # Update delivery statistics
@@ -894,6 +1089,7 @@ class NotificationService:
                 'total_retries': 0,
                 'notifier_stats': {}
             }
+            self._recent_outcomes.clear()
         self.logger.info("Delivery statistics reset")
 
     def test_all_notifiers(self) -> Dict[str, bool]:
@@ -917,17 +1113,8 @@ class NotificationService:
             notification_type="test",
             recipients=test_recipients or self.config.recipients[:1],  # Use first recipient if none specified
             subject=f"{self.config.subject_prefix} Test Notification",
-            body_text="This is a test notification from the Kafka Self-Healing System.\n\nIf you receive this message, notifications are working correctly.",
-            body_html="""
-            <html>
-            <body>
-                <h2>Test Notification</h2>
-                <p>This is a test notification from the Kafka Self-Healing System.</p>
-                <p>If you receive this message, notifications are working correctly.</p>
-                <p><strong>Timestamp:</strong> """ + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + """</p>
-            </body>
-            </html>
-            """
+            body_text=_TEST_NOTIFICATION_TEXT,
+            body_html=_TEST_NOTIFICATION_HTML % datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         )
         
         for notifier_type, notifier in self.notifiers.items():
@@ -960,84 +1147,250 @@ class Notifier(ABC):
         """Test if the notifier can connect to its delivery mechanism."""
         pass
 
+    def close(self) -> None:
+        """Release any resources held by the notifier."""
+
+
+class SMTPConnectionPool:
+    """Bounded pool of SMTP sessions, rotated after a fixed number of messages."""
+
+    def __init__(self, connect: Callable[[], smtplib.SMTP], max_connections: int = 5,
+                 max_messages_per_connection: int = 100):
+        """Initialize pool with a factory that opens an authenticated SMTP session."""
+        self.connect = connect
+        self.max_connections = max_connections
+        self.max_messages_per_connection = max_messages_per_connection
+        self.logger = logging.getLogger(__name__)
+        
+        self._idle: queue.Queue = queue.Queue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def acquire(self) -> Tuple[smtplib.SMTP, int]:
+        """Check out a session and the number of messages it has already sent.
+        
+        Blocks while max_connections sessions are checked out.
+        """
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    smtp, msg_count = self._idle.get_nowait()
+                except queue.Empty:
+                    return self.connect(), 0
+                
+                # Idle sessions may have been dropped by the server
+                try:
+                    smtp.noop()
+                    return smtp, msg_count
+                except Exception:
+                    self._quit(smtp)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, smtp: smtplib.SMTP, msg_count: int, discard: bool = False) -> None:
+        """Return a session to the pool, closing it once its message budget is used."""
+        try:
+            if discard or msg_count >= self.max_messages_per_connection:
+                self._quit(smtp)
+            else:
+                self._idle.put((smtp, msg_count))
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close all idle sessions."""
+        while True:
+            try:
+                smtp, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(smtp)
+
+    def _quit(self, smtp: smtplib.SMTP) -> None:
+        """Close a session, ignoring errors from already dropped connections."""
+        try:
+            smtp.quit()
+        except Exception as e:
+            self.logger.debug(f"Error closing SMTP session: {e}")
+
+
+_SMTP_POLICY = compat32.clone(linesep='\r\n')
+# To header of a message sent to several recipients at once; the actual
+# recipients only appear in the SMTP envelope, so they can't see each other
+_UNDISCLOSED_RECIPIENTS = 'undisclosed-recipients:;'
+
+
+@functools.lru_cache(maxsize=256)
+def _render_mime(subject: str, body_text: str, body_html: Optional[str], sender: str) -> bytes:
+    """Render an email without its To and Date headers, so repeated alerts reuse the encoding."""
+    text_part = MIMEText(body_text, 'plain', 'utf-8')
+    
+    # Only wrap in multipart/alternative when there is an HTML version
+    if body_html:
+        msg = MIMEMultipart('alternative')
+        msg.attach(text_part)
+        msg.attach(MIMEText(body_html, 'html', 'utf-8'))
+    else:
+        msg = text_part
+    
+    msg['Subject'] = subject
+    msg['From'] = sender
+    
+    return msg.as_bytes(policy=_SMTP_POLICY)
+
 
 class EmailNotifier(Notifier):
     """Email notification delivery using SMTP."""
 
-    def __init__(self, config: NotificationConfig):
+    def __init__(self, config: NotificationConfig, pool: Optional[SMTPConnectionPool] = None):
         """Initialize email notifier with SMTP configuration."""
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # Loading CA certificates is costly, so share one context across connections
+        self._ssl_context = ssl.create_default_context() if config.use_ssl or config.use_tls else None
+        self.pool = pool or SMTPConnectionPool(self._create_smtp_connection)
 
     def send(self, message: NotificationMessage) -> List[NotificationResult]:
-        """Send email notification to all recipients."""
-        results = []
+        """Send email notification to all recipients.
+        
+        Every recipient gets the same content, so it is sent in a single SMTP
+        transaction addressed to undisclosed recipients. If that transaction is
+        rejected outright, recipients are retried individually, each with a
+        message addressed only to them, spread round-robin over up to
+        pool.max_connections pooled SMTP sessions sending in parallel.
+        """
+        recipients = list(message.recipients)
+        if not recipients:
+            return []
+        
+        if len(recipients) > 1:
+            results = self._send_transaction(message, recipients)
+            if results is not None:
+                return results
+        
+        workers = min(self.pool.max_connections, len(recipients))
+        if workers <= 1:
+            return self._send_batch(message, recipients)
+        
+        # The fallback is rare, so its threads only live for this call
+        batches = [recipients[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="EmailNotifier") as executor:
+            batch_results = list(executor.map(
+                lambda batch: self._send_batch(message, batch), batches
+            ))
+        
+        # Restore the original recipient order
+        return [batch_results[i % workers][i // workers] for i in range(len(recipients))]
+
+    def close(self) -> None:
+        """Close the pooled SMTP sessions."""
+        self.pool.close()
+
+    def _send_transaction(self, message: NotificationMessage,
+                          recipients: List[str]) -> Optional[List[NotificationResult]]:
+        """Send one SMTP transaction with all recipients in the envelope.
+        
+        Returns None if the transaction failed as a whole.
+        """
+        try:
+            raw_message = self._build_message(message, _UNDISCLOSED_RECIPIENTS)
+            smtp, msg_count = self.pool.acquire()
+        except Exception as e:
+            return [self._failure_result(message, recipient, e) for recipient in recipients]
+        
+        try:
+            refused = smtp.sendmail(self.config.sender_email, recipients, raw_message)
+        except Exception as e:
+            self.logger.warning(f"Batch send of notification {message.notification_id} failed, "
+                                f"retrying recipients individually: {e}")
+            self.pool.release(smtp, msg_count, discard=True)
+            return None
+        
+        self.pool.release(smtp, msg_count + 1)
         
-        for recipient in message.recipients:
-            result = self._send_to_recipient(message, recipient)
-            results.append(result)
+        # Recipients refused at RCPT time would be refused again individually
+        return [
+            self._failure_result(message, recipient, f"recipient refused {refused[recipient]}")
+            if recipient in refused else self._success_result(message, recipient)
+            for recipient in recipients
+        ]
+
+    def _send_batch(self, message: NotificationMessage, recipients: List[str]) -> List[NotificationResult]:
+        """Send the email to each recipient in turn over a single pooled SMTP session."""
+        try:
+            smtp, msg_count = self.pool.acquire()
+        except Exception as e:
+            return [self._failure_result(message, recipient, e) for recipient in recipients]
+        
+        results = []
+        try:
+            for recipient in recipients:
+                results.append(self._send_to_recipient(smtp, message, recipient))
+        finally:
+            # A session that saw errors is in an unknown state, so don't reuse it
+            self.pool.release(smtp, msg_count + len(results),
+                              discard=not all(result.success for result in results))
         
         return results
 
-    def _send_to_recipient(self, message: NotificationMessage, recipient: str) -> NotificationResult:
-        """Send email to a single recipient."""
+    def _build_message(self, message: NotificationMessage, to: str) -> bytes:
+        """Build the wire-format email with the given To header."""
+        headers = Message()
+        headers['To'] = to
+        headers['Date'] = formatdate(localtime=True)
+        
+        # Drop the blank line that ends the header block; the cached part carries the rest
+        header_bytes = headers.as_bytes(policy=_SMTP_POLICY)[:-len(_SMTP_POLICY.linesep)]
+        return header_bytes + _render_mime(message.subject, message.body_text,
+                                           message.body_html, self.config.sender_email)
+
+    def _send_to_recipient(self, smtp: smtplib.SMTP, message: NotificationMessage,
+                           recipient: str) -> NotificationResult:
+        """Send the email, addressed only to recipient, over an open SMTP session."""
         try:
-            # Create email message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = message.subject
-            msg['From'] = self.config.sender_email
-            msg['To'] = recipient
-            msg['Date'] = formatdate(localtime=True)
-            
-            # Add text part
-            text_part = MIMEText(message.body_text, 'plain', 'utf-8')
-            msg.attach(text_part)
-            
-            # Add HTML part if available
-            if message.body_html:
-                html_part = MIMEText(message.body_html, 'html', 'utf-8')
-                msg.attach(html_part)
-            
-            # Send email
-            with self._create_smtp_connection() as smtp:
-                smtp.send_message(msg)
-            
-            self.logger.info(f"Email sent successfully to {recipient} for notification {message.notification_id}")
-            
-            return NotificationResult(
-                notification_id=message.notification_id,
-                recipient=recipient,
-                delivery_time=datetime.now(),
-                success=True,
-                retry_count=message.retry_count
-            )
-            
+            smtp.sendmail(self.config.sender_email, [recipient], self._build_message(message, recipient))
         except Exception as e:
-            error_msg = f"Failed to send email to {recipient}: {str(e)}"
-            self.logger.error(error_msg)
-            
-            return NotificationResult(
-                notification_id=message.notification_id,
-                recipient=recipient,
-                delivery_time=datetime.now(),
-                success=False,
-                error_message=error_msg,
-                retry_count=message.retry_count
-            )
+            return self._failure_result(message, recipient, e)
+        
+        return self._success_result(message, recipient)
+
+    def _success_result(self, message: NotificationMessage, recipient: str) -> NotificationResult:
+        """Build a successful delivery result for a recipient."""
+        self.logger.info(f"Email sent successfully to {recipient} for notification {message.notification_id}")
+        
+        return NotificationResult(
+            notification_id=message.notification_id,
+            recipient=recipient,
+            success=True,
+            retry_count=message.retry_count
+        )
+
+    def _failure_result(self, message: NotificationMessage, recipient: str,
+                        error: Union[Exception, str]) -> NotificationResult:
+        """Build a failed delivery result for a recipient."""
+        error_msg = f"Failed to send email to {recipient}: {str(error)}"
+        self.logger.error(error_msg)
+        
+        return NotificationResult(
+            notification_id=message.notification_id,
+            recipient=recipient,
+            success=False,
+            error_message=error_msg,
+            retry_count=message.retry_count
+        )
 
     def _create_smtp_connection(self) -> smtplib.SMTP:
         """Create and configure SMTP connection."""
         if self.config.use_ssl:
             # Use SSL connection
-            context = ssl.create_default_context()
-            smtp = smtplib.SMTP_SSL(self.config.smtp_host, self.config.smtp_port, context=context)
+            smtp = smtplib.SMTP_SSL(self.config.smtp_host, self.config.smtp_port, context=self._ssl_context)
         else:
             # Use regular connection, potentially with STARTTLS
             smtp = smtplib.SMTP(self.config.smtp_host, self.config.smtp_port)
             
             if self.config.use_tls:
-                context = ssl.create_default_context()
-                smtp.starttls(context=context)
+                smtp.starttls(context=self._ssl_context)
         
         # Authenticate if credentials provided
         if self.config.smtp_username and self.config.smtp_password:
@@ -1048,9 +1401,15 @@ class EmailNotifier(Notifier):
     def test_connection(self) -> bool:
         """Test SMTP connection and authentication."""
         try:
-            with self._create_smtp_connection() as smtp:
-                # Test connection by sending NOOP command
+            # Probe a pooled session so the check doesn't pay for its own
+            # connect, STARTTLS and login before every delivery
+            smtp, msg_count = self.pool.acquire()
+            try:
                 smtp.noop()
+            except Exception:
+                self.pool.release(smtp, msg_count, discard=True)
+                raise
+            self.pool.release(smtp, msg_count)
             
             self.logger.info("SMTP connection test successful")
             return True
@@ -1072,17 +1431,9 @@ class EmailNotifier(Notifier):
             notification_type="test",
             recipients=[recipient],
             subject=f"{self.config.subject_prefix} Test Email",
-            body_text="This is a test email from the Kafka Self-Healing System.\n\nIf you receive this message, email notifications are configured correctly.",
-            body_html="""
-            <html>
-            <body>
-                <h2>Test Email</h2>
-                <p>This is a test email from the Kafka Self-Healing System.</p>
-                <p>If you receive this message, email notifications are configured correctly.</p>
-            </body>
-            </html>
-            """
+            body_text=_TEST_EMAIL_TEXT,
+            body_html=_TEST_EMAIL_HTML
         )
         
-        result = self._send_to_recipient(test_message, recipient)
-        return result.success
\ No newline at end of file
+        results = self.send(test_message)
+        return all(result.success for result in results)
\ No newline at end of file
@@ -262,17 +262,28 @@ class PluginManager:
                 continue
             
             try:
-                if issubclass(obj, MonitoringPlugin) and obj != MonitoringPlugin:
-                    self._register_monitoring_plugin(obj, file_path)
-                elif issubclass(obj, RecoveryPlugin) and obj != RecoveryPlugin:
-                    self._register_recovery_plugin(obj, file_path)
-                elif issubclass(obj, NotificationPlugin) and obj != NotificationPlugin:
-                    self._register_notification_plugin(obj, file_path)
+                self._register_plugin(obj, file_path)
             except Exception as e:
                 error_msg = f"Failed to register plugin class {name} from {file_path}: {e}"
                 logger.error(error_msg)
                 self.plugin_errors[f"{file_path}:{name}"] = error_msg
     
+    def _register_plugin(self, plugin_class: type, file_path: str) -> None:
+        """Register a plugin class according to the plugin type it implements.
+        
+        Classes that are not concrete plugin types are ignored.
+        
+        Args:
+            plugin_class: The candidate plugin class.
+            file_path: Path to the plugin file, used in error reporting.
+        """
+        if issubclass(plugin_class, MonitoringPlugin) and plugin_class != MonitoringPlugin:
+            self._register_monitoring_plugin(plugin_class, file_path)
+        elif issubclass(plugin_class, RecoveryPlugin) and plugin_class != RecoveryPlugin:
+            self._register_recovery_plugin(plugin_class, file_path)
+        elif issubclass(plugin_class, NotificationPlugin) and plugin_class != NotificationPlugin:
+            self._register_notification_plugin(plugin_class, file_path)
+    
     def _register_monitoring_plugin(self, plugin_class: Type[MonitoringPlugin], file_path: str) -> None:
         """Register a monitoring plugin.
         
@@ -430,6 +441,10 @@ class PluginManager:
     
     def cleanup_plugins(self) -> None:
         """Clean up all loaded plugins."""
+        if not (self.monitoring_plugins or self.recovery_plugins or self.notification_plugins
+                or self.loaded_modules or self.plugin_errors):
+            return
+        
         logger.info("Cleaning up plugins")
         
         for plugin in self.monitoring_plugins.values():
@@ -0,0 +1,16 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Replace time.sleep with a recorder so delay-based tests finish instantly.
+
+    Returns the list of requested sleep durations.
+    """
+    calls = []
+    monkeypatch.setattr('src.kafka_self_healing.notification.time.sleep', calls.append)
+    return calls
@@ -0,0 +1 @@
+# End-to-end tests for Kafka self-healing system
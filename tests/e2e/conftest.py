@@ -0,0 +1,64 @@
+"""
+Fixtures for the end-to-end tests, which run against a real KafkaSelfHealingApp.
+"""
+
+from string import Template
+
+import pytest
+
+
+_E2E_CONFIG_TEMPLATE = Template("""
+cluster:
+  cluster_name: "test-cluster"
+  nodes:
+    - node_id: "kafka-1"
+      node_type: "kafka_broker"
+      host: "localhost"
+      port: 9092
+      monitoring_methods: ["socket"]
+      recovery_actions: ["service_restart"]
+  monitoring_interval_seconds: 30
+  default_retry_policy:
+    max_attempts: 2
+    initial_delay_seconds: 1
+    backoff_multiplier: 2.0
+    max_delay_seconds: 10
+
+notification:
+  smtp_host: "localhost"
+  smtp_port: 587
+  smtp_username: "test@example.com"
+  smtp_password: "password"
+  sender_email: "test@example.com"
+  recipients: ["admin@example.com"]
+  subject_prefix: "[Test]"
+
+logging:
+  log_dir: "$temp_dir/logs"
+  log_level: "INFO"
+  console_logging: false
+""")
+
+
+@pytest.fixture(scope="session")
+def config_path(tmp_path_factory):
+    """Write the end-to-end YAML config once per session and return its path."""
+    temp_dir = tmp_path_factory.mktemp("e2e", numbered=False)
+    config_file = temp_dir / "test_config.yaml"
+    config_file.write_text(_E2E_CONFIG_TEMPLATE.substitute(temp_dir=temp_dir))
+    return config_file
+
+
+@pytest.fixture(scope="module")
+def initialized_app(config_path):
+    """Build and initialize one KafkaSelfHealingApp per module.
+
+    Tests share the instance, so patch its services with monkeypatch rather
+    than assigning attributes directly.
+    """
+    # Imported here so only modules using the app pay for loading it
+    from src.kafka_self_healing.main import KafkaSelfHealingApp
+
+    app = KafkaSelfHealingApp(config_path=str(config_path))
+    app.initialize()
+    return app
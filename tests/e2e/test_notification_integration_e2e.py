@@ -0,0 +1,102 @@
+"""
+End-to-end notification tests against a fully initialized KafkaSelfHealingApp.
+
+Kept apart from the notification unit tests so that ``pytest --ignore=tests/e2e``
+skips building the application.
+"""
+
+from datetime import datetime
+from unittest.mock import ANY, Mock
+
+import pytest
+
+from src.kafka_self_healing.integration import FailureEvent, FailureType
+from src.kafka_self_healing.models import NodeStatus, RecoveryResult
+
+
+pytestmark = [pytest.mark.e2e, pytest.mark.xdist_group(name="e2e")]
+
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.mark.parametrize(
+    "side_effect", [None, Exception("SMTP error")], ids=["delivered", "smtp_error"]
+)
+def test_complete_notification_workflow(initialized_app, monkeypatch, side_effect):
+    """Test the failure-to-recovery workflow, including when notification sending fails."""
+    app = initialized_app
+    
+    # Mock notification service methods; with a side_effect every send raises
+    send_failure_alert = Mock(return_value="failure-123", side_effect=side_effect)
+    send_recovery_confirmation = Mock(return_value="recovery-123", side_effect=side_effect)
+    monkeypatch.setattr(app.notification_service, "send_failure_alert", send_failure_alert)
+    monkeypatch.setattr(app.notification_service, "send_recovery_confirmation", send_recovery_confirmation)
+    
+    # Get the node config
+    cluster_config = app.config_manager.get_cluster_config()
+    node_config = cluster_config.nodes[0]
+    
+    # Simulate escalation scenario
+    failed_results = [
+        RecoveryResult(
+            node_id="kafka-1",
+            action_type="service_restart",
+            command_executed="systemctl restart kafka",
+            exit_code=1,
+            stdout="",
+            stderr="Service failed to restart",
+            execution_time=_NOW,
+            success=False
+        )
+    ]
+    
+    # Keep the integrator's cooldown bookkeeping local to this test
+    monkeypatch.setattr(app.integrator, "recovery_cooldown", {})
+    
+    # Trigger escalation through integrator; callbacks must swallow send errors
+    app.integrator._handle_recovery_escalation("kafka-1", failed_results)
+    
+    # Verify failure notification was attempted
+    send_failure_alert.assert_called_once_with(node_config, failed_results, "Service failed to restart")
+    
+    # Simulate recovery scenario
+    successful_result = RecoveryResult(
+        node_id="kafka-1",
+        action_type="service_restart",
+        command_executed="systemctl restart kafka",
+        exit_code=0,
+        stdout="Service restarted successfully",
+        stderr="",
+        execution_time=_NOW,
+        success=True
+    )
+    
+    node_status = NodeStatus(
+        node_id="kafka-1",
+        is_healthy=False,
+        last_check_time=_NOW,
+        response_time_ms=5000.0,
+        error_message="Service unavailable",
+        monitoring_method="socket"
+    )
+    failure_event = FailureEvent(
+        node_config=node_config,
+        node_status=node_status,
+        failure_type=FailureType.SERVICE_UNAVAILABLE,
+        timestamp=_NOW
+    )
+    
+    # Pretend a recovery was in flight and its last attempt succeeded
+    monkeypatch.setitem(app.integrator.active_recoveries, "kafka-1", failure_event)
+    monkeypatch.setattr(app.recovery_engine, "get_recovery_history", Mock(return_value=[successful_result]))
+    
+    # Trigger recovery through integrator
+    app.integrator._handle_node_recovery(node_config, node_status)
+    
+    # Verify recovery notification was attempted; downtime is measured from _NOW to the wall clock
+    send_recovery_confirmation.assert_called_once_with(node_config, successful_result, ANY, [])
+    assert send_recovery_confirmation.call_args[0][2].endswith(" seconds")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -2,19 +2,47 @@
 Unit tests for the notification system.
 """
 
+import dataclasses
+import email
+import sys
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
+import pytest
 from datetime import datetime, timedelta
+from typing import Callable
 import threading
 import time
-import queue
 
 from src.kafka_self_healing.notification import (
     NotificationService, NotificationTemplate, DeliveryQueue,
-    NotificationMessage, NotificationResult, Notifier, EmailNotifier
+    NotificationMessage, NotificationResult, Notifier, EmailNotifier, _render_mime
 )
-from src.kafka_self_healing.models import NodeConfig, RecoveryResult, NotificationConfig, RetryPolicy
-from src.kafka_self_healing.exceptions import NotificationError
+from src.kafka_self_healing.models import NodeConfig, RecoveryResult, NotificationConfig
+
+
+# Canonical test message; recipients is a tuple so copies never share a mutable list
+_BASE_MSG = NotificationMessage(
+    notification_id="test_001",
+    notification_type="failure_alert",
+    recipients=("admin@example.com",),
+    subject="Test Alert",
+    body_text="Test message body"
+)
+
+
+def make_msg(**overrides):
+    """Copy the canonical test message, applying field overrides."""
+    overrides.setdefault("recipients", list(_BASE_MSG.recipients))
+    return dataclasses.replace(_BASE_MSG, **overrides)
+
+
+# Fixed timestamp for test data; patching the module's datetime freezes
+# datetime.now() for the code under test at the same instant
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+_NOW_NS = int(_NOW.timestamp()) * 1_000_000_000
+_DATETIME_PATH = 'src.kafka_self_healing.notification.datetime'
+_SMTP_PATH = 'src.kafka_self_healing.notification.smtplib.SMTP'
+_SMTP_SSL_PATH = 'src.kafka_self_healing.notification.smtplib.SMTP_SSL'
 
 
 class TestNotificationResult(unittest.TestCase):
@@ -25,7 +53,6 @@ class TestNotificationResult(unittest.TestCase):
         result = NotificationResult(
             notification_id="test_001",
             recipient="admin@example.com",
-            delivery_time=datetime.now(),
             success=True,
             retry_count=1
         )
@@ -35,14 +62,15 @@ class TestNotificationResult(unittest.TestCase):
         self.assertTrue(result.success)
         self.assertEqual(result.retry_count, 1)
         self.assertIsNone(result.error_message)
+        self.assertIsInstance(result.delivery_time_ns, int)
+        self.assertIsInstance(result.delivery_time, datetime)
 
     def test_notification_result_to_dict(self):
         """Test converting notification result to dictionary."""
-        delivery_time = datetime.now()
         result = NotificationResult(
             notification_id="test_001",
             recipient="admin@example.com",
-            delivery_time=delivery_time,
+            delivery_time_ns=_NOW_NS,
             success=False,
             error_message="SMTP connection failed",
             retry_count=2
@@ -52,11 +80,19 @@ class TestNotificationResult(unittest.TestCase):
         
         self.assertEqual(result_dict['notification_id'], "test_001")
         self.assertEqual(result_dict['recipient'], "admin@example.com")
-        self.assertEqual(result_dict['delivery_time'], delivery_time.isoformat())
+        self.assertEqual(result_dict['delivery_time'], _NOW.isoformat())
         self.assertFalse(result_dict['success'])
         self.assertEqual(result_dict['error_message'], "SMTP connection failed")
         self.assertEqual(result_dict['retry_count'], 2)
 
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_result_has_no_instance_dict(self):
+        """Test results are slotted so per-delivery objects stay small."""
+        result = fake_result(_BASE_MSG, True)
+        
+        self.assertFalse(hasattr(result, '__dict__'))
+        self.assertEqual(dataclasses.replace(result, success=False).recipient, "admin@example.com")
+
 
 class TestNotificationMessage(unittest.TestCase):
     """Test NotificationMessage data model."""
@@ -81,14 +117,7 @@ class TestNotificationMessage(unittest.TestCase):
 
     def test_should_retry_logic(self):
         """Test retry logic for notification messages."""
-        message = NotificationMessage(
-            notification_id="test_001",
-            notification_type="failure_alert",
-            recipients=["admin@example.com"],
-            subject="Test Alert",
-            body_text="Test message body",
-            max_retries=2
-        )
+        message = make_msg(max_retries=2)
         
         # Should retry initially
         self.assertTrue(message.should_retry())
@@ -103,149 +132,231 @@ class TestNotificationMessage(unittest.TestCase):
 
     def test_schedule_retry(self):
         """Test scheduling retry attempts."""
-        message = NotificationMessage(
-            notification_id="test_001",
-            notification_type="failure_alert",
-            recipients=["admin@example.com"],
-            subject="Test Alert",
-            body_text="Test message body"
-        )
+        message = make_msg()
         
         # Schedule retry
-        before_time = datetime.now()
-        message.schedule_retry(60)
-        after_time = datetime.now()
+        with patch(_DATETIME_PATH, wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = _NOW
+            message.schedule_retry(60)
         
         self.assertEqual(message.retry_count, 1)
-        self.assertIsNotNone(message.next_retry_time)
-        self.assertGreater(message.next_retry_time, before_time + timedelta(seconds=59))
-        self.assertLess(message.next_retry_time, after_time + timedelta(seconds=61))
+        self.assertEqual(message.next_retry_time, datetime(2024, 1, 1, 12, 1, 0))
 
     def test_should_retry_with_scheduled_time(self):
         """Test retry logic with scheduled retry time."""
-        message = NotificationMessage(
-            notification_id="test_001",
-            notification_type="failure_alert",
-            recipients=["admin@example.com"],
-            subject="Test Alert",
-            body_text="Test message body"
-        )
+        message = make_msg()
         
-        # Schedule retry in the future
-        message.next_retry_time = datetime.now() + timedelta(seconds=60)
-        self.assertFalse(message.should_retry())
-        
-        # Schedule retry in the past
-        message.next_retry_time = datetime.now() - timedelta(seconds=60)
-        self.assertTrue(message.should_retry())
-
-
-class TestNotificationTemplate(unittest.TestCase):
+        with patch(_DATETIME_PATH, wraps=datetime) as mock_datetime:
+            mock_datetime.now.return_value = _NOW
+            
+            # Schedule retry in the future
+            message.next_retry_time = _NOW + timedelta(seconds=60)
+            self.assertFalse(message.should_retry())
+            
+            # Retry is due exactly at the scheduled time
+            message.next_retry_time = _NOW
+            self.assertTrue(message.should_retry())
+            
+            # Schedule retry in the past
+            message.next_retry_time = _NOW - timedelta(seconds=60)
+            self.assertTrue(message.should_retry())
+
+
+def assert_all_in(haystack, needles):
+    """Assert every needle is a substring of haystack, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in haystack]
+    assert not missing, f"missing: {missing}"
+
+
+def _recovery_result(action_type, command_executed, stdout="", stderr="",
+                     success=False, minutes_ago=0):
+    """Build a recovery result for kafka-broker-1."""
+    return RecoveryResult(
+        node_id="kafka-broker-1",
+        action_type=action_type,
+        command_executed=command_executed,
+        exit_code=0 if success else 1,
+        stdout=stdout,
+        stderr=stderr,
+        execution_time=_NOW - timedelta(minutes=minutes_ago),
+        success=success
+    )
+
+
+_SUCCESSFUL_RESTART = _recovery_result(
+    "service_restart", "systemctl restart kafka",
+    stdout="Service restarted successfully", success=True
+)
+_SPECIAL_CHARACTERS_RESULT = _recovery_result(
+    "script_execution", "echo 'test with \"quotes\" and $variables'",
+    stdout="Output with <html> tags and & symbols", success=True
+)
+_LAST_SUCCESS = _NOW - timedelta(minutes=30)
+
+# (name, recovery_history, error_message, extra kwargs, expected text, expected html)
+FAILURE_ALERT_CASES = [
+    (
+        "single_failed_attempt",
+        [_recovery_result("service_restart", "systemctl restart kafka",
+                          stderr="Service failed to restart")],
+        "Connection timeout",
+        {},
+        ["kafka-broker-1", "kafka1.example.com", "Port: 9092", "Connection timeout",
+         "service_restart", "FAILED", "systemctl restart kafka", "Service failed to restart"],
+        ["<html>", "kafka-broker-1", "kafka1.example.com", "Connection timeout",
+         "recovery-attempt"],
+    ),
+    (
+        "no_recovery_history",
+        [],
+        "Connection timeout",
+        {},
+        ["No recovery attempts made"],
+        ["No recovery attempts made"],
+    ),
+    (
+        "with_log_excerpts",
+        [_recovery_result("service_restart", "systemctl restart kafka",
+                          stdout="Attempting restart...",
+                          stderr="Service failed to restart: Connection refused")],
+        "Connection timeout",
+        {
+            "last_success_time": _LAST_SUCCESS,
+            "log_excerpts": [
+                "2023-01-01 10:00:00 ERROR: Connection to broker failed",
+                "2023-01-01 10:00:01 WARN: Retrying connection...",
+                "2023-01-01 10:00:02 ERROR: Max retries exceeded",
+            ],
+        },
+        ["Recent Log Excerpts", "Connection to broker failed",
+         _LAST_SUCCESS.strftime('%Y-%m-%d %H:%M:%S'), "Attempting restart...",
+         "Connection refused"],
+        ["Recent Log Excerpts", "Connection to broker failed"],
+    ),
+    (
+        "multiple_recovery_attempts",
+        [
+            _recovery_result("service_restart", "systemctl restart kafka",
+                             stdout="Starting service...",
+                             stderr="Service failed to start: Port already in use",
+                             minutes_ago=10),
+            _recovery_result("process_kill", "pkill -f kafka && systemctl start kafka",
+                             stdout="Killed process 1234",
+                             stderr="Service still failed to start", minutes_ago=5),
+            _recovery_result("script_execution", "/opt/kafka/scripts/cleanup.sh",
+                             stdout="Cleaning up temporary files...",
+                             stderr="Cleanup failed: Permission denied", minutes_ago=2),
+        ],
+        "Multiple recovery failures",
+        {},
+        ["3 total", "service_restart", "process_kill", "script_execution",
+         "Port already in use", "Service still failed to start", "Permission denied"],
+        ["recovery-attempt", "status-failed"],
+    ),
+    (
+        "special_characters",
+        [_SPECIAL_CHARACTERS_RESULT],
+        "Error with <script>alert('xss')</script>",
+        {},
+        ["quotes", "variables", "html", "script"],
+        [],
+    ),
+]
+
+# (name, successful action, downtime, failed attempts, expected text, expected html)
+RECOVERY_CONFIRMATION_CASES = [
+    (
+        "no_failed_attempts",
+        _SUCCESSFUL_RESTART,
+        "5 minutes",
+        None,
+        ["kafka-broker-1", "RECOVERED", "5 minutes", "service_restart",
+         "systemctl restart kafka"],
+        ["<html>", "kafka-broker-1", "RECOVERED", "5 minutes"],
+    ),
+    (
+        "with_failed_attempts",
+        _SUCCESSFUL_RESTART,
+        "8 minutes",
+        [
+            _recovery_result("service_restart", "systemctl restart kafka",
+                             stderr="Service failed to restart", minutes_ago=5),
+            _recovery_result("process_kill", "pkill -f kafka",
+                             stderr="No matching processes found", minutes_ago=3),
+        ],
+        ["Previous Failed Attempts", "service_restart", "process_kill",
+         "Service failed to restart", "No matching processes found",
+         "Total Recovery Attempts: 3"],
+        ["Previous Failed Attempts", "failed-attempt"],
+    ),
+    (
+        "special_characters",
+        _SPECIAL_CHARACTERS_RESULT,
+        "2 minutes",
+        None,
+        ["quotes", "html"],
+        [],
+    ),
+]
+
+
+@pytest.fixture(scope="class")
+def template_engine():
+    """Shared, read-only template engine."""
+    return NotificationTemplate()
+
+
+@pytest.fixture(scope="class")
+def node():
+    """Shared, read-only node configuration."""
+    return NodeConfig(
+        node_id="kafka-broker-1",
+        node_type="kafka_broker",
+        host="kafka1.example.com",
+        port=9092,
+        jmx_port=9999
+    )
+
+
+class TestNotificationTemplate:
     """Test NotificationTemplate functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.template_engine = NotificationTemplate()
-        self.node = NodeConfig(
-            node_id="kafka-broker-1",
-            node_type="kafka_broker",
-            host="kafka1.example.com",
-            port=9092,
-            jmx_port=9999
-        )
-        self.recovery_result = RecoveryResult(
-            node_id="kafka-broker-1",
-            action_type="service_restart",
-            command_executed="systemctl restart kafka",
-            exit_code=0,
-            stdout="Service restarted successfully",
-            stderr="",
-            execution_time=datetime.now(),
-            success=True
-        )
-
-    def test_render_failure_alert(self):
+    @pytest.mark.parametrize(
+        "name,recovery_history,error_message,kwargs,expected_text,expected_html",
+        FAILURE_ALERT_CASES, ids=[case[0] for case in FAILURE_ALERT_CASES]
+    )
+    def test_render_failure_alert(self, template_engine, node, name, recovery_history,
+                                  error_message, kwargs, expected_text, expected_html):
         """Test rendering failure alert notification."""
-        recovery_history = [
-            RecoveryResult(
-                node_id="kafka-broker-1",
-                action_type="service_restart",
-                command_executed="systemctl restart kafka",
-                exit_code=1,
-                stdout="",
-                stderr="Service failed to restart",
-                execution_time=datetime.now(),
-                success=False
-            )
-        ]
-        
-        content = self.template_engine.render_failure_alert(
-            self.node, recovery_history, "Connection timeout", "[Test]"
-        )
-        
-        self.assertIn("subject", content)
-        self.assertIn("text", content)
-        self.assertIn("html", content)
-        
-        # Check subject
-        self.assertIn("[Test]", content["subject"])
-        self.assertIn("kafka-broker-1", content["subject"])
-        
-        # Check text content
-        self.assertIn("kafka-broker-1", content["text"])
-        self.assertIn("kafka1.example.com", content["text"])
-        self.assertIn("Port: 9092", content["text"])
-        self.assertIn("Connection timeout", content["text"])
-        self.assertIn("service_restart", content["text"])
-        self.assertIn("FAILED", content["text"])
-        self.assertIn("systemctl restart kafka", content["text"])
-        self.assertIn("Service failed to restart", content["text"])
-        
-        # Check HTML content
-        self.assertIn("<html>", content["html"])
-        self.assertIn("kafka-broker-1", content["html"])
-        self.assertIn("kafka1.example.com", content["html"])
-        self.assertIn("Connection timeout", content["html"])
-        self.assertIn("recovery-attempt", content["html"])
-
-    def test_render_failure_alert_no_recovery_history(self):
-        """Test rendering failure alert with no recovery history."""
-        content = self.template_engine.render_failure_alert(
-            self.node, [], "Connection timeout", "[Test]"
+        content = template_engine.render_failure_alert(
+            node, recovery_history, error_message, "[Test]", **kwargs
         )
         
-        self.assertIn("No recovery attempts made", content["text"])
-        self.assertIn("No recovery attempts made", content["html"])
-
-    def test_render_recovery_confirmation(self):
+        assert set(content) == {"subject", "text", "html"}
+        assert "[Test]" in content["subject"]
+        assert "kafka-broker-1" in content["subject"]
+        assert_all_in(content["text"], expected_text)
+        assert_all_in(content["html"], expected_html)
+
+    @pytest.mark.parametrize(
+        "name,successful_action,downtime,failed_attempts,expected_text,expected_html",
+        RECOVERY_CONFIRMATION_CASES, ids=[case[0] for case in RECOVERY_CONFIRMATION_CASES]
+    )
+    def test_render_recovery_confirmation(self, template_engine, node, name, successful_action,
+                                          downtime, failed_attempts, expected_text, expected_html):
         """Test rendering recovery confirmation notification."""
-        content = self.template_engine.render_recovery_confirmation(
-            self.node, self.recovery_result, "5 minutes", "[Test]"
+        content = template_engine.render_recovery_confirmation(
+            node, successful_action, downtime, "[Test]", failed_attempts
         )
         
-        self.assertIn("subject", content)
-        self.assertIn("text", content)
-        self.assertIn("html", content)
-        
-        # Check subject
-        self.assertIn("[Test]", content["subject"])
-        self.assertIn("Recovery Success", content["subject"])
-        self.assertIn("kafka-broker-1", content["subject"])
-        
-        # Check text content
-        self.assertIn("kafka-broker-1", content["text"])
-        self.assertIn("RECOVERED", content["text"])
-        self.assertIn("5 minutes", content["text"])
-        self.assertIn("service_restart", content["text"])
-        self.assertIn("systemctl restart kafka", content["text"])
-        
-        # Check HTML content
-        self.assertIn("<html>", content["html"])
-        self.assertIn("kafka-broker-1", content["html"])
-        self.assertIn("RECOVERED", content["html"])
-        self.assertIn("5 minutes", content["html"])
-
-    def test_custom_templates(self):
+        assert set(content) == {"subject", "text", "html"}
+        assert "[Test]" in content["subject"]
+        assert "Recovery Success" in content["subject"]
+        assert "kafka-broker-1" in content["subject"]
+        assert_all_in(content["text"], expected_text)
+        assert_all_in(content["html"], expected_html)
+
+    def test_custom_templates(self, node):
         """Test using custom templates."""
         custom_templates = {
             'failure_alert_subject': 'CUSTOM: $node_id failed'
@@ -253,188 +364,10 @@ class TestNotificationTemplate(unittest.TestCase):
         
         template_engine = NotificationTemplate(custom_templates)
         content = template_engine.render_failure_alert(
-            self.node, [], "Connection timeout", "[Test]"
-        )
-        
-        self.assertEqual(content["subject"], "CUSTOM: kafka-broker-1 failed")
-
-    def test_render_failure_alert_with_log_excerpts(self):
-        """Test rendering failure alert with log excerpts."""
-        recovery_history = [
-            RecoveryResult(
-                node_id="kafka-broker-1",
-                action_type="service_restart",
-                command_executed="systemctl restart kafka",
-                exit_code=1,
-                stdout="Attempting restart...",
-                stderr="Service failed to restart: Connection refused",
-                execution_time=datetime.now(),
-                success=False
-            )
-        ]
-        
-        log_excerpts = [
-            "2023-01-01 10:00:00 ERROR: Connection to broker failed",
-            "2023-01-01 10:00:01 WARN: Retrying connection...",
-            "2023-01-01 10:00:02 ERROR: Max retries exceeded"
-        ]
-        
-        last_success = datetime.now() - timedelta(minutes=30)
-        
-        content = self.template_engine.render_failure_alert(
-            self.node, recovery_history, "Connection timeout", "[Test]",
-            last_success, log_excerpts
+            node, [], "Connection timeout", "[Test]"
         )
         
-        # Check that log excerpts are included
-        self.assertIn("Recent Log Excerpts", content["text"])
-        self.assertIn("Connection to broker failed", content["text"])
-        self.assertIn("Recent Log Excerpts", content["html"])
-        self.assertIn("Connection to broker failed", content["html"])
-        
-        # Check that last success time is included
-        self.assertIn(last_success.strftime('%Y-%m-%d %H:%M:%S'), content["text"])
-        
-        # Check detailed recovery information
-        self.assertIn("Attempting restart...", content["text"])
-        self.assertIn("Connection refused", content["text"])
-
-    def test_render_recovery_confirmation_with_failed_attempts(self):
-        """Test rendering recovery confirmation with failed attempts."""
-        failed_attempts = [
-            RecoveryResult(
-                node_id="kafka-broker-1",
-                action_type="service_restart",
-                command_executed="systemctl restart kafka",
-                exit_code=1,
-                stdout="",
-                stderr="Service failed to restart",
-                execution_time=datetime.now() - timedelta(minutes=5),
-                success=False
-            ),
-            RecoveryResult(
-                node_id="kafka-broker-1",
-                action_type="process_kill",
-                command_executed="pkill -f kafka",
-                exit_code=1,
-                stdout="",
-                stderr="No matching processes found",
-                execution_time=datetime.now() - timedelta(minutes=3),
-                success=False
-            )
-        ]
-        
-        content = self.template_engine.render_recovery_confirmation(
-            self.node, self.recovery_result, "8 minutes", "[Test]", failed_attempts
-        )
-        
-        # Check that failed attempts are included
-        self.assertIn("Previous Failed Attempts", content["text"])
-        self.assertIn("service_restart", content["text"])
-        self.assertIn("process_kill", content["text"])
-        self.assertIn("Service failed to restart", content["text"])
-        self.assertIn("No matching processes found", content["text"])
-        
-        # Check HTML version
-        self.assertIn("Previous Failed Attempts", content["html"])
-        self.assertIn("failed-attempt", content["html"])
-        
-        # Check total attempts count
-        self.assertIn("Total Recovery Attempts: 3", content["text"])
-
-    def test_render_failure_alert_multiple_recovery_attempts(self):
-        """Test rendering failure alert with multiple recovery attempts."""
-        recovery_history = [
-            RecoveryResult(
-                node_id="kafka-broker-1",
-                action_type="service_restart",
-                command_executed="systemctl restart kafka",
-                exit_code=1,
-                stdout="Starting service...",
-                stderr="Service failed to start: Port already in use",
-                execution_time=datetime.now() - timedelta(minutes=10),
-                success=False
-            ),
-            RecoveryResult(
-                node_id="kafka-broker-1",
-                action_type="process_kill",
-                command_executed="pkill -f kafka && systemctl start kafka",
-                exit_code=1,
-                stdout="Killed process 1234",
-                stderr="Service still failed to start",
-                execution_time=datetime.now() - timedelta(minutes=5),
-                success=False
-            ),
-            RecoveryResult(
-                node_id="kafka-broker-1",
-                action_type="script_execution",
-                command_executed="/opt/kafka/scripts/cleanup.sh",
-                exit_code=1,
-                stdout="Cleaning up temporary files...",
-                stderr="Cleanup failed: Permission denied",
-                execution_time=datetime.now() - timedelta(minutes=2),
-                success=False
-            )
-        ]
-        
-        content = self.template_engine.render_failure_alert(
-            self.node, recovery_history, "Multiple recovery failures", "[Test]"
-        )
-        
-        # Check that all attempts are included with details
-        self.assertIn("3 total", content["text"])
-        self.assertIn("service_restart", content["text"])
-        self.assertIn("process_kill", content["text"])
-        self.assertIn("script_execution", content["text"])
-        
-        # Check specific error messages
-        self.assertIn("Port already in use", content["text"])
-        self.assertIn("Service still failed to start", content["text"])
-        self.assertIn("Permission denied", content["text"])
-        
-        # Check HTML formatting
-        self.assertIn("recovery-attempt", content["html"])
-        self.assertIn("status-failed", content["html"])
-
-    def test_render_templates_with_special_characters(self):
-        """Test rendering templates with special characters in data."""
-        # Create node with special characters
-        node = NodeConfig(
-            node_id="kafka-broker-test",
-            node_type="kafka_broker",
-            host="test.example.com",
-            port=9092
-        )
-        
-        recovery_result = RecoveryResult(
-            node_id="kafka-broker-test",
-            action_type="script_execution",
-            command_executed="echo 'test with \"quotes\" and $variables'",
-            exit_code=0,
-            stdout="Output with <html> tags and & symbols",
-            stderr="",
-            execution_time=datetime.now(),
-            success=True
-        )
-        
-        # Test failure alert
-        content = self.template_engine.render_failure_alert(
-            node, [recovery_result], "Error with <script>alert('xss')</script>", "[Test]"
-        )
-        
-        # Should handle special characters safely
-        self.assertIn("quotes", content["text"])
-        self.assertIn("variables", content["text"])
-        self.assertIn("html", content["text"])
-        self.assertIn("script", content["text"])
-        
-        # Test recovery confirmation
-        content = self.template_engine.render_recovery_confirmation(
-            node, recovery_result, "2 minutes", "[Test]"
-        )
-        
-        self.assertIn("quotes", content["text"])
-        self.assertIn("html", content["text"])
+        assert content["subject"] == "CUSTOM: kafka-broker-1 failed"
 
 
 class TestDeliveryQueue(unittest.TestCase):
@@ -442,14 +375,14 @@ class TestDeliveryQueue(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        # Worker threads are replaced with mocks so start/stop is in-memory only
+        self._thread_patch = patch('src.kafka_self_healing.notification.threading.Thread')
+        self.mock_thread = self._thread_patch.start()
+        self.mock_thread.return_value.is_alive.return_value = True
+        self.addCleanup(self._thread_patch.stop)
+
         self.delivery_queue = DeliveryQueue(max_queue_size=10)
-        self.test_message = NotificationMessage(
-            notification_id="test_001",
-            notification_type="failure_alert",
-            recipients=["admin@example.com"],
-            subject="Test Alert",
-            body_text="Test message body"
-        )
+        self.test_message = make_msg()
 
     def tearDown(self):
         """Clean up after tests."""
@@ -467,41 +400,45 @@ class TestDeliveryQueue(unittest.TestCase):
         # Start queue
         self.delivery_queue.start()
         self.assertTrue(self.delivery_queue.running)
-        self.assertIsNotNone(self.delivery_queue.worker_thread)
-        self.assertIsNotNone(self.delivery_queue.retry_thread)
+        self.assertEqual(self.mock_thread.call_count, 2)
+        self.assertEqual(self.mock_thread.return_value.start.call_count, 2)
         self.assertTrue(self.delivery_queue.worker_thread.is_alive())
         self.assertTrue(self.delivery_queue.retry_thread.is_alive())
         
+        # Starting again is a no-op
+        self.delivery_queue.start()
+        self.assertEqual(self.mock_thread.call_count, 2)
+        
         # Stop queue
         self.delivery_queue.stop()
         self.assertFalse(self.delivery_queue.running)
+        self.assertEqual(self.mock_thread.return_value.join.call_count, 2)
+
+    def test_start_stop_multiple_workers(self):
+        """Test a queue with several delivery workers starts and joins them all."""
+        delivery_queue = DeliveryQueue(max_queue_size=10, num_workers=3)
+        
+        delivery_queue.start()
+        self.assertEqual(len(delivery_queue.worker_threads), 3)
+        self.assertEqual(self.mock_thread.call_count, 4)  # Three workers plus the retry thread
+        
+        delivery_queue.stop()
+        self.assertEqual(self.mock_thread.return_value.join.call_count, 4)
 
     def test_enqueue_message(self):
         """Test enqueueing messages."""
-        # Should succeed with empty queue
         self.assertTrue(self.delivery_queue.enqueue(self.test_message))
-        self.assertEqual(self.delivery_queue.queue.qsize(), 1)
-        
-        # Fill up the queue
-        for i in range(9):  # Queue size is 10, already has 1
-            message = NotificationMessage(
-                notification_id=f"test_{i:03d}",
-                notification_type="failure_alert",
-                recipients=["admin@example.com"],
-                subject="Test Alert",
-                body_text="Test message body"
-            )
-            self.assertTrue(self.delivery_queue.enqueue(message))
+        self.assertEqual(self.delivery_queue.approx_size, 1)
+        self.assertIs(self.delivery_queue.queue.get_nowait(), self.test_message)
+
+    def test_enqueue_message_queue_full(self):
+        """Test that enqueue rejects messages once the queue is full."""
+        # Seed the underlying queue directly, bypassing enqueue bookkeeping
+        for i in range(10):
+            self.delivery_queue.queue.put_nowait(make_msg(notification_id=f"t{i}"))
         
-        # Should fail when queue is full
-        overflow_message = NotificationMessage(
-            notification_id="overflow",
-            notification_type="failure_alert",
-            recipients=["admin@example.com"],
-            subject="Test Alert",
-            body_text="Test message body"
-        )
-        self.assertFalse(self.delivery_queue.enqueue(overflow_message))
+        self.assertFalse(self.delivery_queue.enqueue(make_msg(notification_id="overflow")))
+        self.assertEqual(self.delivery_queue.approx_size, 10)
 
     def test_enqueue_retry(self):
         """Test enqueueing retry messages."""
@@ -523,19 +460,48 @@ class TestDeliveryQueue(unittest.TestCase):
         self.assertEqual(sizes['retry_queue'], 1)
 
 
+@pytest.mark.slow
+@pytest.mark.xdist_group(name="threads")
+class TestDeliveryQueueThreads(unittest.TestCase):
+    """Test DeliveryQueue with real worker threads."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.delivery_queue = DeliveryQueue(max_queue_size=10)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        if self.delivery_queue.running:
+            self.delivery_queue.stop()
+
+    def test_start_stop_queue_threads(self):
+        """Test starting and stopping real delivery queue threads."""
+        self.delivery_queue.start()
+        self.assertTrue(self.delivery_queue.running)
+        self.assertTrue(self.delivery_queue.worker_thread.is_alive())
+        self.assertTrue(self.delivery_queue.retry_thread.is_alive())
+        
+        self.delivery_queue.stop()
+        self.assertFalse(self.delivery_queue.running)
+        self.assertFalse(self.delivery_queue.worker_thread.is_alive())
+        self.assertFalse(self.delivery_queue.retry_thread.is_alive())
+
+
 class MockNotifier(Notifier):
     """Mock notifier for testing."""
 
-    def __init__(self, should_succeed: bool = True, delay: float = 0):
+    def __init__(self, should_succeed: bool = True, delay: float = 0,
+                 sleep_fn: Callable[[float], None] = time.sleep):
         self.should_succeed = should_succeed
         self.delay = delay
+        self.sleep_fn = sleep_fn
         self.sent_messages = []
         self.connection_test_result = True
 
     def send(self, message: NotificationMessage) -> NotificationResult:
         """Mock send implementation."""
         if self.delay > 0:
-            time.sleep(self.delay)
+            self.sleep_fn(self.delay)
         
         self.sent_messages.append(message)
         
@@ -543,14 +509,12 @@ class MockNotifier(Notifier):
             return NotificationResult(
                 notification_id=message.notification_id,
                 recipient=message.recipients[0] if message.recipients else "unknown",
-                delivery_time=datetime.now(),
                 success=True
             )
         else:
             return NotificationResult(
                 notification_id=message.notification_id,
                 recipient=message.recipients[0] if message.recipients else "unknown",
-                delivery_time=datetime.now(),
                 success=False,
                 error_message="Mock delivery failure"
             )
@@ -560,16 +524,53 @@ class MockNotifier(Notifier):
         return self.connection_test_result
 
 
+class FakeNotifier(Notifier):
+    """Notifier whose send() delegates to send_fn(message, call_number)."""
+
+    def __init__(self, send_fn, connection_ok=True):
+        self.send_fn = send_fn
+        self.connection_ok = connection_ok
+        self.calls = []
+
+    def send(self, message):
+        self.calls.append(message)
+        return self.send_fn(message, len(self.calls))
+
+    def test_connection(self):
+        return self.connection_ok
+
+
+def fake_result(message, success, error_message=None):
+    """Build a delivery result for the message's first recipient."""
+    return NotificationResult(
+        notification_id=message.notification_id,
+        recipient=message.recipients[0],
+        success=success,
+        error_message=error_message,
+        retry_count=message.retry_count
+    )
+
+
 class MockSMTP:
     """Mock SMTP server for testing."""
     
-    def __init__(self, host, port, should_fail=False):
+    __slots__ = ("host", "port", "should_fail", "refused", "sent_messages", "transactions",
+                 "authenticated", "login_count", "tls_started", "tls_context", "closed", "lock")
+    
+    def __init__(self, host, port, should_fail=False, refused=()):
         self.host = host
         self.port = port
         self.should_fail = should_fail
+        self.refused = set(refused)
         self.sent_messages = []
+        self.transactions = 0
         self.authenticated = False
+        self.login_count = 0
         self.tls_started = False
+        self.tls_context = None
+        self.closed = False
+        # Parallel sends share one mock instance
+        self.lock = threading.Lock()
         
     def __enter__(self):
         if self.should_fail:
@@ -581,23 +582,37 @@ class MockSMTP:
         
     def starttls(self, context=None):
         self.tls_started = True
+        self.tls_context = context
         
     def login(self, username, password):
-        self.authenticated = True
+        with self.lock:
+            self.authenticated = True
+            self.login_count += 1
         
-    def send_message(self, msg):
+    def sendmail(self, from_addr, to_addrs, msg):
         if self.should_fail:
             raise Exception("Failed to send message")
-        self.sent_messages.append(msg)
+        with self.lock:
+            self.transactions += 1
+            # Record one delivered message per accepted recipient
+            for recipient in to_addrs:
+                if recipient not in self.refused:
+                    self.sent_messages.append(email.message_from_bytes(msg))
+        return {recipient: (550, b"No such user") for recipient in to_addrs if recipient in self.refused}
         
     def noop(self):
         if self.should_fail:
             raise Exception("NOOP failed")
+        
+    def quit(self):
+        self.closed = True
 
 
 class MockSMTPSSL(MockSMTP):
     """Mock SMTP SSL server for testing."""
     
+    __slots__ = ("ssl_context",)
+    
     def __init__(self, host, port, context=None, should_fail=False):
         super().__init__(host, port, should_fail)
         self.ssl_context = context
@@ -606,32 +621,43 @@ class MockSMTPSSL(MockSMTP):
 class TestNotificationService(unittest.TestCase):
     """Test NotificationService functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = NotificationConfig(
+    @classmethod
+    def setUpClass(cls):
+        """Set up a service shared by all tests in the class."""
+        cls.config = NotificationConfig(
             smtp_host="smtp.example.com",
             smtp_port=587,
             sender_email="noreply@example.com",
             recipients=["admin@example.com", "ops@example.com"]
         )
-        self.service = NotificationService(self.config)
-        self.node = NodeConfig(
+        cls.service = NotificationService(cls.config)
+        cls.node = NodeConfig(
             node_id="kafka-broker-1",
             node_type="kafka_broker",
             host="kafka1.example.com",
             port=9092
         )
-        self.recovery_result = RecoveryResult(
+        cls.recovery_result = RecoveryResult(
             node_id="kafka-broker-1",
             action_type="service_restart",
             command_executed="systemctl restart kafka",
             exit_code=0,
             stdout="Service restarted successfully",
             stderr="",
-            execution_time=datetime.now(),
+            execution_time=_NOW,
             success=True
         )
 
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the shared service."""
+        if cls.service.delivery_queue.running:
+            cls.service.stop()
+
+    def setUp(self):
+        """Reset shared service state before each test."""
+        self.service._reset_for_test()
+
     def tearDown(self):
         """Clean up after tests."""
         if self.service.delivery_queue.running:
@@ -645,6 +671,8 @@ class TestNotificationService(unittest.TestCase):
         self.assertEqual(len(self.service.notifiers), 0)
         self.assertEqual(len(self.service.delivery_callbacks), 0)
 
+    @pytest.mark.slow
+    @pytest.mark.xdist_group(name="threads")
     def test_start_stop_service(self):
         """Test starting and stopping the notification service."""
         self.service.start()
@@ -661,12 +689,28 @@ class TestNotificationService(unittest.TestCase):
         self.assertIn("email", self.service.notifiers)
         self.assertEqual(self.service.notifiers["email"], mock_notifier)
 
+    def test_stop_closes_notifiers(self):
+        """Test stopping the service closes every registered notifier, even if one fails."""
+        failing, working = Mock(), Mock()
+        failing.close.side_effect = Exception("close failed")
+        self.service.register_notifier("failing", failing)
+        self.service.register_notifier("working", working)
+        
+        self.service.stop()
+        
+        failing.close.assert_called_once_with()
+        working.close.assert_called_once_with()
+
     def test_register_delivery_callback(self):
         """Test registering delivery callbacks."""
-        callback = Mock()
-        self.service.register_delivery_callback(callback)
+        results = []
+        self.service.register_delivery_callback(results.append)
+        
+        self.assertIn(results.append, self.service.delivery_callbacks)
         
-        self.assertIn(callback, self.service.delivery_callbacks)
+        result = fake_result(_BASE_MSG, True)
+        self.service._notify_delivery_result(result)
+        self.assertEqual(results, [result])
 
     def test_send_failure_alert(self):
         """Test sending failure alert."""
@@ -680,7 +724,7 @@ class TestNotificationService(unittest.TestCase):
         self.assertTrue(notification_id.startswith("notif_"))
         
         # Check that message was queued
-        self.assertEqual(self.service.delivery_queue.queue.qsize(), 1)
+        self.assertEqual(self.service.delivery_queue.approx_size, 1)
 
     def test_send_recovery_confirmation(self):
         """Test sending recovery confirmation."""
@@ -692,7 +736,7 @@ class TestNotificationService(unittest.TestCase):
         self.assertTrue(notification_id.startswith("notif_"))
         
         # Check that message was queued
-        self.assertEqual(self.service.delivery_queue.queue.qsize(), 1)
+        self.assertEqual(self.service.delivery_queue.approx_size, 1)
 
     def test_get_status(self):
         """Test getting service status."""
@@ -713,17 +757,114 @@ class TestNotificationService(unittest.TestCase):
 
     def test_generate_notification_id(self):
         """Test notification ID generation."""
-        id1 = self.service._generate_notification_id()
-        id2 = self.service._generate_notification_id()
+        ids = [self.service._generate_notification_id() for _ in range(100)]
+        
+        self.assertEqual(len(set(ids)), 100)
+        self.assertTrue(all(i.startswith("notif_") for i in ids))
+
+    def test_notification_id_uses_creation_time(self):
+        """Test each notification ID carries the time it was generated, not the service start time."""
+        later = _NOW + timedelta(hours=5)
+        with patch(_DATETIME_PATH) as mock_datetime:
+            mock_datetime.now.return_value = later
+            notification_id = self.service._generate_notification_id()
+        
+        self.assertTrue(notification_id.startswith("notif_20240101_170000_"))
+
+    def test_fail_fast_aborts_pending_notifications(self):
+        """Test queued notifications are failed without delivery once most recent attempts fail."""
+        notifier = FakeNotifier(lambda m, n: fake_result(m, False, "SMTP outage"))
+        self.service.register_notifier("failing", notifier)
+        results = []
+        self.service.register_delivery_callback(results.append)
+        
+        for i in range(40):
+            self.service.delivery_queue.enqueue(make_msg(notification_id=f"storm_{i}", body_text=f"Failure {i}"))
         
-        self.assertNotEqual(id1, id2)
-        self.assertTrue(id1.startswith("notif_"))
-        self.assertTrue(id2.startswith("notif_"))
+        pending = self.service.delivery_queue.queue
+        while not pending.empty():
+            self.service._process_delivery_message(pending.get_nowait())
+            pending.task_done()
+        
+        aborted = [r for r in results if r.error_message == "Batch aborted: failure rate exceeded threshold"]
+        self.assertEqual(len(notifier.calls), NotificationService.FAIL_FAST_MIN_RESULTS)
+        self.assertEqual(len(aborted), 40 - NotificationService.FAIL_FAST_MIN_RESULTS)
+        self.assertEqual(self.service.get_delivery_statistics()['total_failed'], 40)
+
+    def test_coalesce_identical_pending_notifications(self):
+        """Test a backlog of identical alerts is delivered as one message."""
+        notifier = FakeNotifier(lambda m, n: fake_result(m, True))
+        self.service.register_notifier("fake", notifier)
+        results = []
+        self.service.register_delivery_callback(results.append)
+        storm = NotificationService.COALESCE_QUEUE_DEPTH + 2
+        
+        for i in range(storm):
+            self.service.delivery_queue.enqueue(make_msg(notification_id=f"storm_{i}",
+                                                         recipients=[f"oncall{i % 2}@example.com"]))
+        self.service.delivery_queue.enqueue(make_msg(notification_id="other", body_text="Different body"))
+        
+        pending = self.service.delivery_queue.queue
+        while not pending.empty():
+            self.service._process_delivery_message(pending.get_nowait())
+            pending.task_done()
+        
+        self.assertEqual([m.notification_id for m in notifier.calls], ["storm_0", "other"])
+        self.assertEqual(notifier.calls[0].recipients, ["oncall0@example.com", "oncall1@example.com"])
+        self.assertEqual(pending.unfinished_tasks, 0)
+        
+        # Every original notification still gets a result of its own
+        self.assertEqual(sorted(r.notification_id for r in results),
+                         sorted([f"storm_{i}" for i in range(storm)] + ["other"]))
+        self.assertTrue(all(r.success for r in results))
+        stats = self.service.get_delivery_statistics()
+        self.assertEqual(stats['total_delivered'], storm + 1)
+
+    def test_coalesced_delivery_failure_retries_each_notification(self):
+        """Test notifications absorbed into a failed delivery are failed and retried individually."""
+        notifier = FakeNotifier(lambda m, n: fake_result(m, False, "SMTP outage"))
+        self.service.register_notifier("fake", notifier)
+        results = []
+        self.service.register_delivery_callback(results.append)
+        storm = NotificationService.COALESCE_QUEUE_DEPTH + 1
+        
+        for i in range(storm):
+            self.service.delivery_queue.enqueue(make_msg(notification_id=f"storm_{i}", retry_count=i % 2))
+        
+        self.service._process_delivery_message(self.service.delivery_queue.queue.get_nowait())
+        
+        self.assertEqual(len(notifier.calls), 1)
+        self.assertEqual(sorted(r.notification_id for r in results),
+                         sorted(f"storm_{i}" for i in range(storm)))
+        self.assertFalse(any(r.success for r in results))
+        # Absorbed messages keep their own retry counts
+        self.assertEqual({r.notification_id: r.retry_count for r in results},
+                         {f"storm_{i}": i % 2 for i in range(storm)})
+        retried = sorted(m.notification_id for m in self.service.delivery_queue.retry_queue.queue)
+        self.assertEqual(retried, sorted(f"storm_{i}" for i in range(storm)))
+
+    def test_reset_for_test(self):
+        """Test clearing service state between tests."""
+        self.service.register_notifier("email", MockNotifier())
+        self.service.register_delivery_callback(Mock())
+        self.service.send_failure_alert(self.node, [], "Connection timeout")
+        
+        self.service._reset_for_test()
+        
+        self.assertEqual(len(self.service.notifiers), 0)
+        self.assertEqual(len(self.service.delivery_callbacks), 0)
+        self.assertEqual(self.service.delivery_queue.approx_size, 0)
+        self.assertEqual(self.service.get_delivery_statistics()['total_sent'], 0)
 
     def test_notify_delivery_result(self):
         """Test notifying delivery result callbacks."""
-        callback1 = Mock()
-        callback2 = Mock()
+        calls = []
+        
+        def callback1(r):
+            calls.append(("callback1", r))
+        
+        def callback2(r):
+            calls.append(("callback2", r))
         
         self.service.register_delivery_callback(callback1)
         self.service.register_delivery_callback(callback2)
@@ -731,19 +872,23 @@ class TestNotificationService(unittest.TestCase):
         result = NotificationResult(
             notification_id="test_001",
             recipient="admin@example.com",
-            delivery_time=datetime.now(),
             success=True
         )
         
         self.service._notify_delivery_result(result)
         
-        callback1.assert_called_once_with(result)
-        callback2.assert_called_once_with(result)
+        self.assertEqual(calls, [("callback1", result), ("callback2", result)])
 
     def test_notify_delivery_result_with_exception(self):
         """Test handling exceptions in delivery result callbacks."""
-        callback_error = Mock(side_effect=Exception("Callback error"))
-        callback_ok = Mock()
+        calls = []
+        
+        def callback_error(r):
+            calls.append(("err", r))
+            raise RuntimeError("Callback error")
+        
+        def callback_ok(r):
+            calls.append(("ok", r))
         
         self.service.register_delivery_callback(callback_error)
         self.service.register_delivery_callback(callback_ok)
@@ -751,53 +896,57 @@ class TestNotificationService(unittest.TestCase):
         result = NotificationResult(
             notification_id="test_001",
             recipient="admin@example.com",
-            delivery_time=datetime.now(),
             success=True
         )
         
         # Should not raise exception
         self.service._notify_delivery_result(result)
         
-        callback_error.assert_called_once_with(result)
-        callback_ok.assert_called_once_with(result)
+        self.assertEqual(calls, [("err", result), ("ok", result)])
 
 
-class TestNotifier(unittest.TestCase):
+class TestNotifier:
     """Test Notifier abstract base class."""
 
     def test_notifier_is_abstract(self):
         """Test that Notifier cannot be instantiated directly."""
-        with self.assertRaises(TypeError):
+        with pytest.raises(TypeError):
             Notifier()
 
     def test_mock_notifier_implementation(self):
         """Test mock notifier implementation."""
         notifier = MockNotifier()
         
-        message = NotificationMessage(
-            notification_id="test_001",
-            notification_type="failure_alert",
-            recipients=["admin@example.com"],
-            subject="Test Alert",
-            body_text="Test message body"
-        )
+        message = make_msg()
         
         result = notifier.send(message)
         
-        self.assertTrue(result.success)
-        self.assertEqual(result.notification_id, "test_001")
-        self.assertEqual(result.recipient, "admin@example.com")
-        self.assertEqual(len(notifier.sent_messages), 1)
+        assert result.success
+        assert result.notification_id == "test_001"
+        assert result.recipient == "admin@example.com"
+        assert len(notifier.sent_messages) == 1
+        
+        assert notifier.test_connection()
+
+    def test_mock_notifier_delay(self, fake_sleep):
+        """Test simulated delivery latency without waiting on the wall clock."""
+        notifier = MockNotifier(delay=2.5, sleep_fn=fake_sleep.append)
+        
+        message = make_msg()
+        
+        result = notifier.send(message)
         
-        self.assertTrue(notifier.test_connection())
+        assert result.success
+        assert fake_sleep == [2.5]
 
 
 class TestEmailNotifier(unittest.TestCase):
     """Test EmailNotifier functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = NotificationConfig(
+    @classmethod
+    def setUpClass(cls):
+        """Set up configuration and message shared by all tests in the class."""
+        cls.config = NotificationConfig(
             smtp_host="smtp.example.com",
             smtp_port=587,
             smtp_username="user@example.com",
@@ -806,21 +955,25 @@ class TestEmailNotifier(unittest.TestCase):
             sender_email="noreply@example.com",
             recipients=["admin@example.com", "ops@example.com"]
         )
+        cls.test_message = make_msg(body_html="<html><body>Test message body</body></html>")
+
+    def setUp(self):
+        """Patch smtplib.SMTP and create a notifier per test; its SMTP pool holds sessions between sends."""
+        patcher = patch(_SMTP_PATH)
+        self.smtp_class = patcher.start()
+        self.addCleanup(patcher.stop)
         self.notifier = EmailNotifier(self.config)
-        self.test_message = NotificationMessage(
-            notification_id="test_001",
-            notification_type="failure_alert",
-            recipients=["admin@example.com"],
-            subject="Test Alert",
-            body_text="Test message body",
-            body_html="<html><body>Test message body</body></html>"
-        )
+        self.addCleanup(self.notifier.close)
 
-    @patch('src.kafka_self_healing.notification.smtplib.SMTP')
-    def test_send_email_success(self, mock_smtp_class):
+    def _serve_smtp(self, port=587, **kwargs):
+        """Make the patched smtplib.SMTP return a fresh MockSMTP."""
+        mock_smtp = MockSMTP("smtp.example.com", port, **kwargs)
+        self.smtp_class.return_value = mock_smtp
+        return mock_smtp
+
+    def test_send_email_success(self):
         """Test successful email sending."""
-        mock_smtp = MockSMTP("smtp.example.com", 587)
-        mock_smtp_class.return_value = mock_smtp
+        mock_smtp = self._serve_smtp()
         
         results = self.notifier.send(self.test_message)
         
@@ -832,11 +985,9 @@ class TestEmailNotifier(unittest.TestCase):
         self.assertTrue(mock_smtp.authenticated)
         self.assertTrue(mock_smtp.tls_started)
 
-    @patch('src.kafka_self_healing.notification.smtplib.SMTP')
-    def test_send_email_multiple_recipients(self, mock_smtp_class):
+    def test_send_email_multiple_recipients(self):
         """Test sending email to multiple recipients."""
-        mock_smtp = MockSMTP("smtp.example.com", 587)
-        mock_smtp_class.return_value = mock_smtp
+        mock_smtp = self._serve_smtp()
         
         message = NotificationMessage(
             notification_id="test_002",
@@ -853,12 +1004,97 @@ class TestEmailNotifier(unittest.TestCase):
         self.assertEqual(results[0].recipient, "admin@example.com")
         self.assertEqual(results[1].recipient, "ops@example.com")
         self.assertEqual(len(mock_smtp.sent_messages), 2)
+        # Both recipients share one connected, authenticated session and transaction
+        self.assertEqual(self.smtp_class.call_count, 1)
+        self.assertEqual(mock_smtp.login_count, 1)
+        self.assertEqual(mock_smtp.transactions, 1)
+        # The message is built once; recipients only appear in the SMTP envelope
+        self.assertEqual(mock_smtp.sent_messages[0].as_bytes(), mock_smtp.sent_messages[1].as_bytes())
+        self.assertEqual(mock_smtp.sent_messages[0]['To'], "undisclosed-recipients:;")
+        for recipient in ("admin@example.com", "ops@example.com"):
+            self.assertNotIn(recipient, mock_smtp.sent_messages[0].as_string())
+
+    def test_send_email_refused_recipient(self):
+        """Test recipients refused by the server fail without affecting the rest."""
+        mock_smtp = self._serve_smtp(refused=["ops@example.com"])
+        
+        results = self.notifier.send(make_msg(recipients=["admin@example.com", "ops@example.com"]))
+        
+        self.assertTrue(results[0].success)
+        self.assertFalse(results[1].success)
+        self.assertIn("550", results[1].error_message)
+        self.assertEqual(mock_smtp.transactions, 1)
+
+    def test_send_email_batch_failure_falls_back(self):
+        """Test a rejected batch transaction is retried per recipient."""
+        self._serve_smtp(should_fail=True)
+        
+        results = self.notifier.send(make_msg(recipients=["admin@example.com", "ops@example.com"]))
+        
+        self.assertEqual([r.recipient for r in results], ["admin@example.com", "ops@example.com"])
+        self.assertFalse(any(r.success for r in results))
+        # One session for the batch, then one per parallel worker
+        self.assertEqual(self.smtp_class.call_count, 3)
+        # The fallback's worker threads do not outlive the call
+        self.assertFalse([t for t in threading.enumerate() if t.name.startswith("EmailNotifier")])
+
+    def test_pool_reuse(self):
+        """Test pooled sessions are reused until the per-connection budget is spent."""
+        mock_smtp = self._serve_smtp()
+        
+        for _ in range(100):
+            self.notifier.send(self.test_message)
+        self.assertEqual(self.smtp_class.call_count, 1)
+        self.assertTrue(mock_smtp.closed)
+        
+        self.notifier.send(self.test_message)
+        self.assertEqual(self.smtp_class.call_count, 2)
+        self.assertEqual(len(mock_smtp.sent_messages), 101)
+
+    def test_service_delivery_reuses_pooled_sessions(self):
+        """Test the per-delivery connection probe runs on pooled sessions instead of opening its own."""
+        mock_smtp = self._serve_smtp()
+        service = NotificationService(self.config)
+        service.register_notifier("email", self.notifier)
+        
+        for i in range(20):
+            service._process_delivery_message(make_msg(notification_id=f"n_{i}", body_text=f"Failure {i}"))
+        
+        self.assertEqual(len(mock_smtp.sent_messages), 20)
+        self.assertLessEqual(self.smtp_class.call_count, self.notifier.pool.max_connections)
+        self.assertEqual(mock_smtp.login_count, self.smtp_class.call_count)
+
+    def test_pool_discards_failed_session(self):
+        """Test a session that failed to send is not returned to the pool."""
+        self._serve_smtp(should_fail=True)
+        self.notifier.send(self.test_message)
+        
+        self._serve_smtp()
+        results = self.notifier.send(self.test_message)
+        
+        self.assertTrue(results[0].success)
+        self.assertEqual(self.smtp_class.call_count, 2)
+
+    def test_close_quits_pooled_sessions(self):
+        """Test closing the notifier closes idle pooled sessions."""
+        mock_smtp = self._serve_smtp()
+        self.notifier.send(self.test_message)
+        self.assertFalse(mock_smtp.closed)
+        
+        self.notifier.close()
+        
+        self.assertTrue(mock_smtp.closed)
+
+    def test_send_email_no_recipients(self):
+        """Test a message without recipients sends nothing and opens no session."""
+        results = self.notifier.send(make_msg(recipients=[]))
+        
+        self.assertEqual(results, [])
+        self.smtp_class.assert_not_called()
 
-    @patch('src.kafka_self_healing.notification.smtplib.SMTP')
-    def test_send_email_failure(self, mock_smtp_class):
+    def test_send_email_failure(self):
         """Test email sending failure."""
-        mock_smtp = MockSMTP("smtp.example.com", 587, should_fail=True)
-        mock_smtp_class.return_value = mock_smtp
+        self._serve_smtp(should_fail=True)
         
         results = self.notifier.send(self.test_message)
         
@@ -867,7 +1103,7 @@ class TestEmailNotifier(unittest.TestCase):
         self.assertIsNotNone(results[0].error_message)
         self.assertIn("Failed to send email", results[0].error_message)
 
-    @patch('src.kafka_self_healing.notification.smtplib.SMTP_SSL')
+    @patch(_SMTP_SSL_PATH)
     def test_send_email_ssl(self, mock_smtp_ssl_class):
         """Test email sending with SSL."""
         config = NotificationConfig(
@@ -889,8 +1125,18 @@ class TestEmailNotifier(unittest.TestCase):
         self.assertTrue(results[0].success)
         mock_smtp_ssl_class.assert_called_once()
 
-    @patch('src.kafka_self_healing.notification.smtplib.SMTP')
-    def test_send_email_no_auth(self, mock_smtp_class):
+    def test_ssl_context_reused(self):
+        """Test every connection shares the notifier's SSL context."""
+        mock_smtp = self._serve_smtp()
+        
+        self.notifier._create_smtp_connection()
+        first_context = mock_smtp.tls_context
+        self.notifier._create_smtp_connection()
+        
+        self.assertIsNotNone(first_context)
+        self.assertIs(mock_smtp.tls_context, first_context)
+
+    def test_send_email_no_auth(self):
         """Test email sending without authentication."""
         config = NotificationConfig(
             smtp_host="smtp.example.com",
@@ -901,8 +1147,7 @@ class TestEmailNotifier(unittest.TestCase):
         )
         notifier = EmailNotifier(config)
         
-        mock_smtp = MockSMTP("smtp.example.com", 25)
-        mock_smtp_class.return_value = mock_smtp
+        mock_smtp = self._serve_smtp(port=25)
         
         results = notifier.send(self.test_message)
         
@@ -911,31 +1156,25 @@ class TestEmailNotifier(unittest.TestCase):
         self.assertFalse(mock_smtp.authenticated)
         self.assertFalse(mock_smtp.tls_started)
 
-    @patch('src.kafka_self_healing.notification.smtplib.SMTP')
-    def test_test_connection_success(self, mock_smtp_class):
+    def test_test_connection_success(self):
         """Test successful connection test."""
-        mock_smtp = MockSMTP("smtp.example.com", 587)
-        mock_smtp_class.return_value = mock_smtp
+        self._serve_smtp()
         
         result = self.notifier.test_connection()
         
         self.assertTrue(result)
 
-    @patch('src.kafka_self_healing.notification.smtplib.SMTP')
-    def test_test_connection_failure(self, mock_smtp_class):
+    def test_test_connection_failure(self):
         """Test connection test failure."""
-        mock_smtp = MockSMTP("smtp.example.com", 587, should_fail=True)
-        mock_smtp_class.return_value = mock_smtp
+        self._serve_smtp(should_fail=True)
         
         result = self.notifier.test_connection()
         
         self.assertFalse(result)
 
-    @patch('src.kafka_self_healing.notification.smtplib.SMTP')
-    def test_send_test_email(self, mock_smtp_class):
+    def test_send_test_email(self):
         """Test sending test email."""
-        mock_smtp = MockSMTP("smtp.example.com", 587)
-        mock_smtp_class.return_value = mock_smtp
+        mock_smtp = self._serve_smtp()
         
         result = self.notifier.send_test_email("test@example.com")
         
@@ -965,11 +1204,9 @@ class TestEmailNotifier(unittest.TestCase):
         
         self.assertFalse(result)
 
-    @patch('src.kafka_self_healing.notification.smtplib.SMTP')
-    def test_send_test_email_default_recipient(self, mock_smtp_class):
+    def test_send_test_email_default_recipient(self):
         """Test sending test email to default recipient."""
-        mock_smtp = MockSMTP("smtp.example.com", 587)
-        mock_smtp_class.return_value = mock_smtp
+        mock_smtp = self._serve_smtp()
         
         result = self.notifier.send_test_email()  # No recipient specified
         
@@ -982,47 +1219,71 @@ class TestEmailNotifier(unittest.TestCase):
 
     def test_email_message_structure(self):
         """Test email message structure and content."""
-        with patch('src.kafka_self_healing.notification.smtplib.SMTP') as mock_smtp_class:
-            mock_smtp = MockSMTP("smtp.example.com", 587)
-            mock_smtp_class.return_value = mock_smtp
-            
-            results = self.notifier.send(self.test_message)
-            
-            self.assertTrue(results[0].success)
-            self.assertEqual(len(mock_smtp.sent_messages), 1)
-            
-            sent_msg = mock_smtp.sent_messages[0]
-            self.assertEqual(sent_msg['Subject'], "Test Alert")
-            self.assertEqual(sent_msg['From'], "noreply@example.com")
-            self.assertEqual(sent_msg['To'], "admin@example.com")
-            self.assertIn('Date', sent_msg)
-            
-            # Check multipart structure
-            self.assertTrue(sent_msg.is_multipart())
-            parts = sent_msg.get_payload()
-            self.assertEqual(len(parts), 2)  # Text and HTML parts
-            
-            # Check text part
-            text_part = parts[0]
-            self.assertEqual(text_part.get_content_type(), 'text/plain')
-            # Decode the payload to check content
-            text_content = text_part.get_payload(decode=True).decode('utf-8')
-            self.assertIn("Test message body", text_content)
-            
-            # Check HTML part
-            html_part = parts[1]
-            self.assertEqual(html_part.get_content_type(), 'text/html')
-            # Decode the payload to check content
-            html_content = html_part.get_payload(decode=True).decode('utf-8')
-            self.assertIn("<html>", html_content)
+        mock_smtp = self._serve_smtp()
+        
+        results = self.notifier.send(self.test_message)
+        
+        self.assertTrue(results[0].success)
+        self.assertEqual(len(mock_smtp.sent_messages), 1)
+        
+        sent_msg = mock_smtp.sent_messages[0]
+        self.assertEqual(sent_msg['Subject'], "Test Alert")
+        self.assertEqual(sent_msg['From'], "noreply@example.com")
+        self.assertEqual(sent_msg['To'], "admin@example.com")
+        self.assertIn('Date', sent_msg)
+        
+        # Check multipart structure
+        self.assertTrue(sent_msg.is_multipart())
+        parts = sent_msg.get_payload()
+        self.assertEqual(len(parts), 2)  # Text and HTML parts
+        
+        # Check text part
+        text_part = parts[0]
+        self.assertEqual(text_part.get_content_type(), 'text/plain')
+        # Decode the payload to check content
+        text_content = text_part.get_payload(decode=True).decode('utf-8')
+        self.assertIn("Test message body", text_content)
+        
+        # Check HTML part
+        html_part = parts[1]
+        self.assertEqual(html_part.get_content_type(), 'text/html')
+        # Decode the payload to check content
+        html_content = html_part.get_payload(decode=True).decode('utf-8')
+        self.assertIn("<html>", html_content)
+
+    def test_repeated_alert_reuses_rendered_mime(self):
+        """Test identical alerts reuse the cached MIME rendering with fresh headers."""
+        mock_smtp = self._serve_smtp()
+        _render_mime.cache_clear()
+        
+        self.notifier.send(self.test_message)
+        self.notifier.send(make_msg(body_html=self.test_message.body_html, recipients=["ops@example.com"]))
+        
+        self.assertEqual(_render_mime.cache_info().hits, 1)
+        self.assertEqual([m['To'] for m in mock_smtp.sent_messages], ["admin@example.com", "ops@example.com"])
+        self.assertTrue(all(m['Date'] for m in mock_smtp.sent_messages))
+
+    def test_text_only_single_part(self):
+        """Test messages without HTML are sent as a single text/plain part."""
+        mock_smtp = self._serve_smtp()
+        
+        results = self.notifier.send(make_msg(body_html=None))
+        
+        self.assertTrue(results[0].success)
+        sent_msg = mock_smtp.sent_messages[0]
+        self.assertFalse(sent_msg.is_multipart())
+        self.assertEqual(sent_msg.get_content_type(), 'text/plain')
+        self.assertEqual(sent_msg['Subject'], "Test Alert")
+        self.assertIn("Test message body", sent_msg.get_payload(decode=True).decode('utf-8'))
 
 
 class TestNotificationIntegration(unittest.TestCase):
     """Integration tests for notification delivery and retry functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = NotificationConfig(
+    @classmethod
+    def setUpClass(cls):
+        """Set up configuration and node shared by all tests in the class."""
+        cls.config = NotificationConfig(
             smtp_host="smtp.example.com",
             smtp_port=587,
             smtp_username="user@example.com",
@@ -1031,45 +1292,46 @@ class TestNotificationIntegration(unittest.TestCase):
             sender_email="noreply@example.com",
             recipients=["admin@example.com", "ops@example.com"]
         )
-        self.service = NotificationService(self.config)
-        self.node = NodeConfig(
+        cls.node = NodeConfig(
             node_id="kafka-broker-1",
             node_type="kafka_broker",
             host="kafka1.example.com",
             port=9092
         )
 
+    def setUp(self):
+        """Create a service per test; its delivery queue and statistics are mutable."""
+        self.service = NotificationService(self.config)
+
     def tearDown(self):
         """Clean up after tests."""
         if self.service.delivery_queue.running:
             self.service.stop()
 
+    def _track_results(self, expected):
+        """Collect delivery results; the returned event is set once `expected` arrive."""
+        results = []
+        done = threading.Event()
+
+        def on_result(result):
+            results.append(result)
+            if len(results) >= expected:
+                done.set()
+
+        self.service.register_delivery_callback(on_result)
+        return results, done
+
+    @pytest.mark.xdist_group(name="threads")
     def test_delivery_statistics_tracking(self):
         """Test delivery statistics tracking."""
-        # Create mixed success/failure notifier
-        class MixedNotifier(Notifier):
-            def __init__(self):
-                self.call_count = 0
-                
-            def send(self, message):
-                self.call_count += 1
-                success = self.call_count % 2 == 0  # Every other call succeeds
-                return NotificationResult(
-                    notification_id=message.notification_id,
-                    recipient=message.recipients[0],
-                    delivery_time=datetime.now(),
-                    success=success,
-                    error_message=None if success else "Simulated failure"
-                )
-                    
-            def test_connection(self):
-                return True
-
-        self.service.register_notifier("mixed", MixedNotifier())
+        # Create mixed success/failure notifier; every other call succeeds
+        mixed = FakeNotifier(lambda m, n: fake_result(
+            m, n % 2 == 0, None if n % 2 == 0 else "Simulated failure"
+        ))
+        self.service.register_notifier("mixed", mixed)
         
         # Track delivery results
-        results = []
-        self.service.register_delivery_callback(lambda r: results.append(r))
+        results, done = self._track_results(4)
         
         self.service.start()
         
@@ -1079,14 +1341,7 @@ class TestNotificationIntegration(unittest.TestCase):
                 self.node, [], f"Test failure {i}"
             )
         
-        # Wait for processing
-        import time
-        timeout = 5
-        start_time = time.time()
-        
-        while len(results) < 4 and (time.time() - start_time) < timeout:
-            time.sleep(0.1)
-        
+        self.assertTrue(done.wait(timeout=5))
         self.service.stop()
         
         # Check statistics
@@ -1100,33 +1355,12 @@ class TestNotificationIntegration(unittest.TestCase):
     def test_notifier_connection_testing(self):
         """Test notifier connection testing functionality."""
         # Create notifiers with different connection states
-        class GoodNotifier(Notifier):
-            def send(self, message):
-                return NotificationResult(
-                    notification_id=message.notification_id,
-                    recipient=message.recipients[0],
-                    delivery_time=datetime.now(),
-                    success=True
-                )
-                    
-            def test_connection(self):
-                return True
-
-        class BadNotifier(Notifier):
-            def send(self, message):
-                return NotificationResult(
-                    notification_id=message.notification_id,
-                    recipient=message.recipients[0],
-                    delivery_time=datetime.now(),
-                    success=False,
-                    error_message="Connection failed"
-                )
-                    
-            def test_connection(self):
-                return False
-
-        self.service.register_notifier("good", GoodNotifier())
-        self.service.register_notifier("bad", BadNotifier())
+        good = FakeNotifier(lambda m, n: fake_result(m, True))
+        bad = FakeNotifier(lambda m, n: fake_result(m, False, "Connection failed"),
+                           connection_ok=False)
+
+        self.service.register_notifier("good", good)
+        self.service.register_notifier("bad", bad)
         
         # Test all notifiers
         results = self.service.test_all_notifiers()
@@ -1136,77 +1370,40 @@ class TestNotificationIntegration(unittest.TestCase):
 
     def test_send_test_notifications(self):
         """Test sending test notifications."""
-        # Create mock notifier
-        class TestNotifier(Notifier):
-            def __init__(self):
-                self.sent_messages = []
-                
-            def send(self, message):
-                self.sent_messages.append(message)
-                return NotificationResult(
-                    notification_id=message.notification_id,
-                    recipient=message.recipients[0],
-                    delivery_time=datetime.now(),
-                    success=True
-                )
-                    
-            def test_connection(self):
-                return True
-
-        notifier = TestNotifier()
+        notifier = FakeNotifier(lambda m, n: fake_result(m, True))
         self.service.register_notifier("test", notifier)
         
         # Send test notifications
         results = self.service.send_test_notifications(["test@example.com"])
         
         self.assertTrue(results["test"])
-        self.assertEqual(len(notifier.sent_messages), 1)
+        self.assertEqual(len(notifier.calls), 1)
         
         # Verify test message content
-        test_message = notifier.sent_messages[0]
+        test_message = notifier.calls[0]
         self.assertEqual(test_message.notification_type, "test")
         self.assertIn("Test Notification", test_message.subject)
         self.assertIn("test notification", test_message.body_text.lower())
 
+    @pytest.mark.xdist_group(name="threads")
     def test_delivery_failure_handling(self):
         """Test handling of delivery failures."""
         # Create notifier that always fails
-        class FailingNotifier(Notifier):
-            def __init__(self):
-                self.attempt_count = 0
-                
-            def send(self, message):
-                self.attempt_count += 1
-                return NotificationResult(
-                    notification_id=message.notification_id,
-                    recipient=message.recipients[0],
-                    delivery_time=datetime.now(),
-                    success=False,
-                    error_message=f"Simulated failure {self.attempt_count}",
-                    retry_count=message.retry_count
-                )
-                    
-            def test_connection(self):
-                return True
-
-        notifier = FailingNotifier()
+        notifier = FakeNotifier(lambda m, n: fake_result(m, False, f"Simulated failure {n}"))
         self.service.register_notifier("failing", notifier)
         
         # Track delivery results
-        results = []
-        self.service.register_delivery_callback(lambda r: results.append(r))
+        results, done = self._track_results(1)
         
         self.service.start()
         
         # Send a notification that will fail
-        notification_id = self.service.send_failure_alert(
+        self.service.send_failure_alert(
             self.node, [], "Test failure"
         )
         
         # Wait for initial processing
-        import time
-        time.sleep(2)
-        
+        self.assertTrue(done.wait(timeout=2))
         self.service.stop()
         
         # Verify we got at least one result
@@ -1217,32 +1414,20 @@ class TestNotificationIntegration(unittest.TestCase):
         self.assertIn("Simulated failure", results[0].error_message)
         
         # Verify that the notifier was called
-        self.assertGreater(notifier.attempt_count, 0)
+        self.assertGreater(len(notifier.calls), 0)
 
+    @pytest.mark.xdist_group(name="threads")
     def test_statistics_reset(self):
         """Test resetting delivery statistics."""
-        # Create simple notifier
-        class SimpleNotifier(Notifier):
-            def send(self, message):
-                return NotificationResult(
-                    notification_id=message.notification_id,
-                    recipient=message.recipients[0],
-                    delivery_time=datetime.now(),
-                    success=True
-                )
-                    
-            def test_connection(self):
-                return True
-
-        self.service.register_notifier("simple", SimpleNotifier())
+        self.service.register_notifier("simple", FakeNotifier(lambda m, n: fake_result(m, True)))
+        _, done = self._track_results(1)
         self.service.start()
         
         # Send a notification
         self.service.send_failure_alert(self.node, [], "Test failure")
         
         # Wait for processing
-        import time
-        time.sleep(1)
+        self.assertTrue(done.wait(timeout=2))
         
         # Check initial statistics
         stats = self.service.get_delivery_statistics()
@@ -1259,21 +1444,19 @@ class TestNotificationIntegration(unittest.TestCase):
         
         self.service.stop()
 
+    @pytest.mark.xdist_group(name="threads")
     def test_no_notifiers_registered(self):
         """Test behavior when no notifiers are registered."""
         # Don't register any notifiers
-        results = []
-        self.service.register_delivery_callback(lambda r: results.append(r))
+        results, done = self._track_results(1)
         
         self.service.start()
         
         # Send notification
-        notification_id = self.service.send_failure_alert(self.node, [], "Test failure")
+        self.service.send_failure_alert(self.node, [], "Test failure")
         
         # Wait for processing
-        import time
-        time.sleep(2)
-        
+        self.assertTrue(done.wait(timeout=2))
         self.service.stop()
         
         # Should have received error result eventually
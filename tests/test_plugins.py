@@ -2,13 +2,11 @@
 Unit tests for the plugin system.
 """
 
-import os
-import tempfile
-import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from src.kafka_self_healing.exceptions import PluginError, PluginLoadError, PluginValidationError
+import pytest
+
 from src.kafka_self_healing.models import NodeConfig, NodeStatus, RecoveryResult
 from src.kafka_self_healing.plugins import (
     MonitoringPlugin,
@@ -19,283 +17,61 @@ from src.kafka_self_healing.plugins import (
 )
 
 
-class TestPluginBase(unittest.TestCase):
-    """Test cases for PluginBase class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a concrete implementation for testing
-        class TestPlugin(PluginBase):
-            def validate_config(self):
-                return True
-            
-            def initialize(self):
-                return True
-            
-            def cleanup(self):
-                pass
-        
-        self.TestPlugin = TestPlugin
-    
-    def test_plugin_base_initialization(self):
-        """Test plugin base initialization."""
-        config = {'test_key': 'test_value'}
-        plugin = self.TestPlugin(config)
-        
-        self.assertEqual(plugin.config, config)
-        self.assertEqual(plugin.name, 'TestPlugin')
-        self.assertEqual(plugin.version, '1.0.0')
-        self.assertEqual(plugin.description, '')
-    
-    def test_plugin_base_initialization_no_config(self):
-        """Test plugin base initialization without config."""
-        plugin = self.TestPlugin()
-        
-        self.assertEqual(plugin.config, {})
-        self.assertEqual(plugin.name, 'TestPlugin')
-    
-    def test_plugin_base_get_info(self):
-        """Test plugin info retrieval."""
-        plugin = self.TestPlugin()
-        info = plugin.get_info()
-        
-        expected_info = {
-            'name': 'TestPlugin',
-            'version': '1.0.0',
-            'description': ''
-        }
-        self.assertEqual(info, expected_info)
-    
-    def test_plugin_base_with_custom_attributes(self):
-        """Test plugin base with custom version and description."""
-        class CustomPlugin(PluginBase):
-            __version__ = '2.1.0'
-            __description__ = 'Custom test plugin'
-            
-            def validate_config(self):
-                return True
-            
-            def initialize(self):
-                return True
-            
-            def cleanup(self):
-                pass
-        
-        plugin = CustomPlugin()
-        self.assertEqual(plugin.version, '2.1.0')
-        self.assertEqual(plugin.description, 'Custom test plugin')
-
-
-class TestMonitoringPlugin(unittest.TestCase):
-    """Test cases for MonitoringPlugin class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        class TestMonitoringPlugin(MonitoringPlugin):
-            def validate_config(self):
-                return True
-            
-            def initialize(self):
-                return True
-            
-            def cleanup(self):
-                pass
-            
-            def check_health(self, node):
-                return NodeStatus(
-                    node_id=node.node_id,
-                    is_healthy=True,
-                    last_check_time=None,
-                    response_time_ms=100.0,
-                    error_message=None,
-                    monitoring_method='test'
-                )
-            
-            def supports_node_type(self, node_type):
-                return node_type == 'kafka_broker'
-        
-        self.TestMonitoringPlugin = TestMonitoringPlugin
-    
-    def test_monitoring_plugin_check_health(self):
-        """Test monitoring plugin health check."""
-        plugin = self.TestMonitoringPlugin()
-        node = NodeConfig(
-            node_id='test-node',
-            node_type='kafka_broker',
-            host='localhost',
-            port=9092,
-            jmx_port=None,
-            monitoring_methods=[],
-            recovery_actions=[],
-            retry_policy=None
-        )
-        
-        status = plugin.check_health(node)
-        self.assertEqual(status.node_id, 'test-node')
-        self.assertTrue(status.is_healthy)
-        self.assertEqual(status.response_time_ms, 100.0)
-    
-    def test_monitoring_plugin_supports_node_type(self):
-        """Test monitoring plugin node type support."""
-        plugin = self.TestMonitoringPlugin()
-        
-        self.assertTrue(plugin.supports_node_type('kafka_broker'))
-        self.assertFalse(plugin.supports_node_type('zookeeper'))
-
-
-class TestRecoveryPlugin(unittest.TestCase):
-    """Test cases for RecoveryPlugin class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        class TestRecoveryPlugin(RecoveryPlugin):
-            def validate_config(self):
-                return True
-            
-            def initialize(self):
-                return True
-            
-            def cleanup(self):
-                pass
-            
-            def execute_recovery(self, node, failure_type):
-                return RecoveryResult(
-                    node_id=node.node_id,
-                    action_type='test_recovery',
-                    command_executed='test command',
-                    exit_code=0,
-                    stdout='success',
-                    stderr='',
-                    execution_time=None,
-                    success=True
-                )
-            
-            def supports_recovery_type(self, recovery_type):
-                return recovery_type == 'service_restart'
-        
-        self.TestRecoveryPlugin = TestRecoveryPlugin
-    
-    def test_recovery_plugin_execute_recovery(self):
-        """Test recovery plugin execution."""
-        plugin = self.TestRecoveryPlugin()
-        node = NodeConfig(
-            node_id='test-node',
-            node_type='kafka_broker',
-            host='localhost',
-            port=9092,
-            jmx_port=None,
-            monitoring_methods=[],
-            recovery_actions=[],
-            retry_policy=None
+class _NoOpLifecycle:
+    """Valid, always-initializing plugin lifecycle for the test plugins."""
+    
+    def validate_config(self):
+        return True
+    
+    def initialize(self):
+        return True
+    
+    def cleanup(self):
+        pass
+
+
+class _TestMonitoringPlugin(_NoOpLifecycle, MonitoringPlugin):
+    def check_health(self, node):
+        return NodeStatus(
+            node_id=node.node_id,
+            is_healthy=True,
+            last_check_time=None,
+            response_time_ms=100.0,
+            error_message=None,
+            monitoring_method='test'
         )
-        
-        result = plugin.execute_recovery(node, 'service_failure')
-        self.assertEqual(result.node_id, 'test-node')
-        self.assertEqual(result.action_type, 'test_recovery')
-        self.assertTrue(result.success)
-    
-    def test_recovery_plugin_supports_recovery_type(self):
-        """Test recovery plugin recovery type support."""
-        plugin = self.TestRecoveryPlugin()
-        
-        self.assertTrue(plugin.supports_recovery_type('service_restart'))
-        self.assertFalse(plugin.supports_recovery_type('script_execution'))
-
-
-class TestNotificationPlugin(unittest.TestCase):
-    """Test cases for NotificationPlugin class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        class TestNotificationPlugin(NotificationPlugin):
-            def validate_config(self):
-                return True
-            
-            def initialize(self):
-                return True
-            
-            def cleanup(self):
-                pass
-            
-            def send_notification(self, message, subject, recipients):
-                return True
-            
-            def supports_notification_type(self, notification_type):
-                return notification_type == 'email'
-        
-        self.TestNotificationPlugin = TestNotificationPlugin
-    
-    def test_notification_plugin_send_notification(self):
-        """Test notification plugin sending."""
-        plugin = self.TestNotificationPlugin()
-        
-        result = plugin.send_notification(
-            'Test message',
-            'Test subject',
-            ['test@example.com']
+    
+    def supports_node_type(self, node_type):
+        return node_type == 'kafka_broker'
+
+
+class _TestRecoveryPlugin(_NoOpLifecycle, RecoveryPlugin):
+    def execute_recovery(self, node, failure_type):
+        return RecoveryResult(
+            node_id=node.node_id,
+            action_type='test_recovery',
+            command_executed='test command',
+            exit_code=0,
+            stdout='success',
+            stderr='',
+            execution_time=None,
+            success=True
         )
-        self.assertTrue(result)
-    
-    def test_notification_plugin_supports_notification_type(self):
-        """Test notification plugin type support."""
-        plugin = self.TestNotificationPlugin()
-        
-        self.assertTrue(plugin.supports_notification_type('email'))
-        self.assertFalse(plugin.supports_notification_type('slack'))
-
-
-class TestPluginManager(unittest.TestCase):
-    """Test cases for PluginManager class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.plugin_manager = PluginManager()
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.plugin_manager.cleanup_plugins()
-        # Clean up temp directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    def test_plugin_manager_initialization(self):
-        """Test plugin manager initialization."""
-        plugin_dirs = ['/path/to/plugins']
-        manager = PluginManager(plugin_dirs)
-        
-        self.assertEqual(manager.plugin_dirs, plugin_dirs)
-        self.assertEqual(len(manager.monitoring_plugins), 0)
-        self.assertEqual(len(manager.recovery_plugins), 0)
-        self.assertEqual(len(manager.notification_plugins), 0)
-    
-    def test_add_plugin_directory(self):
-        """Test adding plugin directory."""
-        plugin_dir = '/path/to/plugins'
-        self.plugin_manager.add_plugin_directory(plugin_dir)
-        
-        self.assertIn(plugin_dir, self.plugin_manager.plugin_dirs)
-    
-    def test_add_plugin_directory_duplicate(self):
-        """Test adding duplicate plugin directory."""
-        plugin_dir = '/path/to/plugins'
-        self.plugin_manager.add_plugin_directory(plugin_dir)
-        self.plugin_manager.add_plugin_directory(plugin_dir)
-        
-        self.assertEqual(self.plugin_manager.plugin_dirs.count(plugin_dir), 1)
-    
-    def test_load_plugins_nonexistent_directory(self):
-        """Test loading plugins from nonexistent directory."""
-        self.plugin_manager.add_plugin_directory('/nonexistent/path')
-        
-        # Should not raise exception
-        self.plugin_manager.load_plugins()
-        self.assertEqual(len(self.plugin_manager.monitoring_plugins), 0)
-    
-    def test_load_valid_monitoring_plugin(self):
-        """Test loading a valid monitoring plugin."""
-        # Create a valid monitoring plugin file
-        plugin_content = '''
+    
+    def supports_recovery_type(self, recovery_type):
+        return recovery_type == 'service_restart'
+
+
+class _TestNotificationPlugin(_NoOpLifecycle, NotificationPlugin):
+    def send_notification(self, message, subject, recipients):
+        return True
+    
+    def supports_notification_type(self, notification_type):
+        return notification_type == 'email'
+
+
+# Plugin sources shared by the loading tests; compiled once per session below
+_MON_SRC = '''
 from src.kafka_self_healing.plugins import MonitoringPlugin
 from src.kafka_self_healing.models import NodeStatus
 
@@ -322,19 +98,8 @@ class TestMonitoringPlugin(MonitoringPlugin):
     def supports_node_type(self, node_type):
         return True
 '''
-        
-        plugin_file = Path(self.temp_dir) / 'test_monitoring_plugin.py'
-        plugin_file.write_text(plugin_content)
-        
-        self.plugin_manager.add_plugin_directory(self.temp_dir)
-        self.plugin_manager.load_plugins()
-        
-        self.assertEqual(len(self.plugin_manager.monitoring_plugins), 1)
-        self.assertIn('TestMonitoringPlugin', self.plugin_manager.monitoring_plugins)
-    
-    def test_load_valid_recovery_plugin(self):
-        """Test loading a valid recovery plugin."""
-        plugin_content = '''
+
+_REC_SRC = '''
 from src.kafka_self_healing.plugins import RecoveryPlugin
 from src.kafka_self_healing.models import RecoveryResult
 
@@ -363,19 +128,8 @@ class TestRecoveryPlugin(RecoveryPlugin):
     def supports_recovery_type(self, recovery_type):
         return True
 '''
-        
-        plugin_file = Path(self.temp_dir) / 'test_recovery_plugin.py'
-        plugin_file.write_text(plugin_content)
-        
-        self.plugin_manager.add_plugin_directory(self.temp_dir)
-        self.plugin_manager.load_plugins()
-        
-        self.assertEqual(len(self.plugin_manager.recovery_plugins), 1)
-        self.assertIn('TestRecoveryPlugin', self.plugin_manager.recovery_plugins)
-    
-    def test_load_valid_notification_plugin(self):
-        """Test loading a valid notification plugin."""
-        plugin_content = '''
+
+_NOT_SRC = '''
 from src.kafka_self_healing.plugins import NotificationPlugin
 
 class TestNotificationPlugin(NotificationPlugin):
@@ -394,19 +148,9 @@ class TestNotificationPlugin(NotificationPlugin):
     def supports_notification_type(self, notification_type):
         return True
 '''
-        
-        plugin_file = Path(self.temp_dir) / 'test_notification_plugin.py'
-        plugin_file.write_text(plugin_content)
-        
-        self.plugin_manager.add_plugin_directory(self.temp_dir)
-        self.plugin_manager.load_plugins()
-        
-        self.assertEqual(len(self.plugin_manager.notification_plugins), 1)
-        self.assertIn('TestNotificationPlugin', self.plugin_manager.notification_plugins)
-    
-    def test_load_plugin_with_validation_failure(self):
-        """Test loading plugin that fails validation."""
-        plugin_content = '''
+
+# Plugins the manager must reject: failed validation, failed initialization, bad syntax
+_FAIL_VALIDATE_SRC = '''
 from src.kafka_self_healing.plugins import MonitoringPlugin
 
 class FailingValidationPlugin(MonitoringPlugin):
@@ -425,19 +169,8 @@ class FailingValidationPlugin(MonitoringPlugin):
     def supports_node_type(self, node_type):
         return True
 '''
-        
-        plugin_file = Path(self.temp_dir) / 'failing_validation_plugin.py'
-        plugin_file.write_text(plugin_content)
-        
-        self.plugin_manager.add_plugin_directory(self.temp_dir)
-        self.plugin_manager.load_plugins()
-        
-        # Plugin should not be loaded due to validation failure
-        self.assertEqual(len(self.plugin_manager.monitoring_plugins), 0)
-    
-    def test_load_plugin_with_initialization_failure(self):
-        """Test loading plugin that fails initialization."""
-        plugin_content = '''
+
+_FAIL_INIT_SRC = '''
 from src.kafka_self_healing.plugins import MonitoringPlugin
 
 class FailingInitializationPlugin(MonitoringPlugin):
@@ -456,19 +189,8 @@ class FailingInitializationPlugin(MonitoringPlugin):
     def supports_node_type(self, node_type):
         return True
 '''
-        
-        plugin_file = Path(self.temp_dir) / 'failing_init_plugin.py'
-        plugin_file.write_text(plugin_content)
-        
-        self.plugin_manager.add_plugin_directory(self.temp_dir)
-        self.plugin_manager.load_plugins()
-        
-        # Plugin should not be loaded due to initialization failure
-        self.assertEqual(len(self.plugin_manager.monitoring_plugins), 0)
-    
-    def test_load_invalid_plugin_syntax(self):
-        """Test loading plugin with syntax errors."""
-        plugin_content = '''
+
+_BAD_SYNTAX_SRC = '''
 from src.kafka_self_healing.plugins import MonitoringPlugin
 
 class InvalidSyntaxPlugin(MonitoringPlugin):
@@ -489,118 +211,367 @@ class InvalidSyntaxPlugin(MonitoringPlugin):
     def supports_node_type(self, node_type):
         return True
 '''
-        
-        plugin_file = Path(self.temp_dir) / 'invalid_syntax_plugin.py'
-        plugin_file.write_text(plugin_content)
-        
-        self.plugin_manager.add_plugin_directory(self.temp_dir)
-        self.plugin_manager.load_plugins()
-        
-        # Plugin should not be loaded due to syntax error
-        self.assertEqual(len(self.plugin_manager.monitoring_plugins), 0)
-        self.assertTrue(len(self.plugin_manager.plugin_errors) > 0)
-    
-    def test_get_plugin_methods(self):
-        """Test plugin retrieval methods."""
-        # Create and load test plugins
-        self.test_load_valid_monitoring_plugin()
-        self.test_load_valid_recovery_plugin()
-        self.test_load_valid_notification_plugin()
-        
-        # Test get all plugins
-        monitoring_plugins = self.plugin_manager.get_monitoring_plugins()
-        recovery_plugins = self.plugin_manager.get_recovery_plugins()
-        notification_plugins = self.plugin_manager.get_notification_plugins()
-        
-        self.assertEqual(len(monitoring_plugins), 1)
-        self.assertEqual(len(recovery_plugins), 1)
-        self.assertEqual(len(notification_plugins), 1)
-        
-        # Test get specific plugins
-        monitoring_plugin = self.plugin_manager.get_monitoring_plugin('TestMonitoringPlugin')
-        recovery_plugin = self.plugin_manager.get_recovery_plugin('TestRecoveryPlugin')
-        notification_plugin = self.plugin_manager.get_notification_plugin('TestNotificationPlugin')
-        
-        self.assertIsNotNone(monitoring_plugin)
-        self.assertIsNotNone(recovery_plugin)
-        self.assertIsNotNone(notification_plugin)
-        
-        # Test get nonexistent plugins
-        self.assertIsNone(self.plugin_manager.get_monitoring_plugin('NonexistentPlugin'))
-        self.assertIsNone(self.plugin_manager.get_recovery_plugin('NonexistentPlugin'))
-        self.assertIsNone(self.plugin_manager.get_notification_plugin('NonexistentPlugin'))
-    
-    def test_get_plugin_errors(self):
-        """Test plugin error retrieval."""
-        # Load invalid plugin to generate errors
-        self.test_load_invalid_plugin_syntax()
-        
-        errors = self.plugin_manager.get_plugin_errors()
-        self.assertTrue(len(errors) > 0)
-        
-        # Ensure it returns a copy
-        errors['test'] = 'test'
-        original_errors = self.plugin_manager.get_plugin_errors()
-        self.assertNotIn('test', original_errors)
-    
-    def test_cleanup_plugins(self):
-        """Test plugin cleanup."""
-        # Load test plugins
-        self.test_load_valid_monitoring_plugin()
-        self.test_load_valid_recovery_plugin()
-        self.test_load_valid_notification_plugin()
-        
-        # Verify plugins are loaded
-        self.assertEqual(len(self.plugin_manager.monitoring_plugins), 1)
-        self.assertEqual(len(self.plugin_manager.recovery_plugins), 1)
-        self.assertEqual(len(self.plugin_manager.notification_plugins), 1)
-        
-        # Cleanup plugins
-        self.plugin_manager.cleanup_plugins()
-        
-        # Verify plugins are cleaned up
-        self.assertEqual(len(self.plugin_manager.monitoring_plugins), 0)
-        self.assertEqual(len(self.plugin_manager.recovery_plugins), 0)
-        self.assertEqual(len(self.plugin_manager.notification_plugins), 0)
-        self.assertEqual(len(self.plugin_manager.loaded_modules), 0)
-        self.assertEqual(len(self.plugin_manager.plugin_errors), 0)
-    
-    @patch('src.kafka_self_healing.plugins.logger')
-    def test_plugin_cleanup_with_errors(self, mock_logger):
-        """Test plugin cleanup with errors."""
-        # Create a plugin that raises exception during cleanup
-        plugin_content = '''
-from src.kafka_self_healing.plugins import MonitoringPlugin
 
-class ErrorCleanupPlugin(MonitoringPlugin):
-    def validate_config(self):
-        return True
+# File name each valid plugin is written under in the shared directory
+_PLUGIN_FILES = {
+    'monitoring': ('test_monitoring_plugin.py', _MON_SRC),
+    'recovery': ('test_recovery_plugin.py', _REC_SRC),
+    'notification': ('test_notification_plugin.py', _NOT_SRC),
+}
+
+
+@pytest.fixture(scope="session")
+def shared_plugin_dir(tmp_path_factory):
+    """Write and byte-compile every valid plugin once into a single directory."""
+    # Only needed when the file-loader tests are selected
+    import py_compile
+    
+    plugin_dir = tmp_path_factory.mktemp("shared_plugins")
+    for file_name, source in _PLUGIN_FILES.values():
+        source_path = plugin_dir / file_name
+        source_path.write_text(source)
+        # Lands in __pycache__, so every later load_plugins() skips compilation
+        py_compile.compile(str(source_path), doraise=True)
+    return plugin_dir
+
+
+def _load_shared(plugin_dir):
+    """Return a PluginManager that loaded every plugin from plugin_dir in one scan."""
+    manager = PluginManager([str(plugin_dir)])
+    manager.load_plugins()
+    return manager
+
+
+@pytest.fixture(scope="module")
+def loaded_manager(shared_plugin_dir):
+    """PluginManager with one plugin of each kind, loaded once for read-only tests."""
+    manager = _load_shared(shared_plugin_dir)
+    yield manager
+    manager.cleanup_plugins()
+
+
+@pytest.fixture
+def fresh_loaded_manager(shared_plugin_dir):
+    """Per-test PluginManager with one plugin of each kind, for tests that mutate it."""
+    manager = _load_shared(shared_plugin_dir)
+    yield manager
+    manager.cleanup_plugins()
+
+
+@pytest.fixture(scope="module")
+def base_plugin_class():
+    """Concrete PluginBase implementation for testing."""
+    class TestPlugin(_NoOpLifecycle, PluginBase):
+        pass
     
-    def initialize(self):
-        return True
+    return TestPlugin
+
+
+@pytest.fixture(scope="module")
+def base_plugin(base_plugin_class):
+    """Default-config PluginBase instance; the tests only read from it."""
+    return base_plugin_class()
+
+
+@pytest.fixture(scope="module")
+def node():
+    """Kafka broker node handed to the plugin hooks."""
+    return NodeConfig(
+        node_id='test-node',
+        node_type='kafka_broker',
+        host='localhost',
+        port=9092,
+        jmx_port=None,
+        monitoring_methods=[],
+        recovery_actions=[],
+        retry_policy=None
+    )
+
+
+@pytest.fixture(scope="module")
+def monitoring_plugin():
+    """Read-only monitoring plugin instance."""
+    return _TestMonitoringPlugin()
+
+
+@pytest.fixture(scope="module")
+def recovery_plugin():
+    """Read-only recovery plugin instance."""
+    return _TestRecoveryPlugin()
+
+
+@pytest.fixture(scope="module")
+def notification_plugin():
+    """Read-only notification plugin instance."""
+    return _TestNotificationPlugin()
+
+
+@pytest.fixture
+def plugin_manager():
+    """Empty PluginManager, cleaned up after each test."""
+    manager = PluginManager()
+    yield manager
+    manager.cleanup_plugins()
+
+
+def _register_in_memory(manager, plugin_class):
+    """Register a plugin class directly, skipping the file loader."""
+    manager._register_plugin(plugin_class, f'<{plugin_class.__name__}>')
+
+
+def test_plugin_base_initialization(base_plugin_class):
+    """Test plugin base initialization."""
+    config = {'test_key': 'test_value'}
+    plugin = base_plugin_class(config)
+    
+    assert plugin.config == config
+    assert plugin.name == 'TestPlugin'
+    assert plugin.version == '1.0.0'
+    assert plugin.description == ''
+
+
+def test_plugin_base_initialization_no_config(base_plugin):
+    """Test plugin base initialization without config."""
+    assert base_plugin.config == {}
+    assert base_plugin.name == 'TestPlugin'
+
+
+def test_plugin_base_get_info(base_plugin):
+    """Test plugin info retrieval."""
+    info = base_plugin.get_info()
+    
+    expected_info = {
+        'name': 'TestPlugin',
+        'version': '1.0.0',
+        'description': ''
+    }
+    assert info == expected_info
+
+
+def test_plugin_base_with_custom_attributes():
+    """Test plugin base with custom version and description."""
+    class CustomPlugin(_NoOpLifecycle, PluginBase):
+        __version__ = '2.1.0'
+        __description__ = 'Custom test plugin'
+    
+    plugin = CustomPlugin()
+    assert plugin.version == '2.1.0'
+    assert plugin.description == 'Custom test plugin'
+
+
+def test_monitoring_plugin_check_health(monitoring_plugin, node):
+    """Test monitoring plugin health check."""
+    status = monitoring_plugin.check_health(node)
+    assert status.node_id == 'test-node'
+    assert status.is_healthy
+    assert status.response_time_ms == 100.0
+
+
+def test_monitoring_plugin_supports_node_type(monitoring_plugin):
+    """Test monitoring plugin node type support."""
+    assert monitoring_plugin.supports_node_type('kafka_broker')
+    assert not monitoring_plugin.supports_node_type('zookeeper')
+
+
+def test_recovery_plugin_execute_recovery(recovery_plugin, node):
+    """Test recovery plugin execution."""
+    result = recovery_plugin.execute_recovery(node, 'service_failure')
+    assert result.node_id == 'test-node'
+    assert result.action_type == 'test_recovery'
+    assert result.success
+
+
+def test_recovery_plugin_supports_recovery_type(recovery_plugin):
+    """Test recovery plugin recovery type support."""
+    assert recovery_plugin.supports_recovery_type('service_restart')
+    assert not recovery_plugin.supports_recovery_type('script_execution')
+
+
+def test_notification_plugin_send_notification(notification_plugin):
+    """Test notification plugin sending."""
+    result = notification_plugin.send_notification(
+        'Test message',
+        'Test subject',
+        ['test@example.com']
+    )
+    assert result
+
+
+def test_notification_plugin_supports_notification_type(notification_plugin):
+    """Test notification plugin type support."""
+    assert notification_plugin.supports_notification_type('email')
+    assert not notification_plugin.supports_notification_type('slack')
+
+
+def test_plugin_manager_initialization():
+    """Test plugin manager initialization."""
+    plugin_dirs = ['/path/to/plugins']
+    manager = PluginManager(plugin_dirs)
+    
+    assert manager.plugin_dirs == plugin_dirs
+    assert not manager.monitoring_plugins
+    assert not manager.recovery_plugins
+    assert not manager.notification_plugins
+
+
+def test_add_plugin_directory(plugin_manager):
+    """Test adding plugin directory."""
+    plugin_dir = '/path/to/plugins'
+    plugin_manager.add_plugin_directory(plugin_dir)
     
-    def cleanup(self):
-        raise Exception("Cleanup error")
+    assert plugin_dir in plugin_manager.plugin_dirs
+
+
+def test_add_plugin_directory_duplicate(plugin_manager):
+    """Test adding duplicate plugin directory."""
+    plugin_dir = '/path/to/plugins'
+    plugin_manager.add_plugin_directory(plugin_dir)
+    plugin_manager.add_plugin_directory(plugin_dir)
     
-    def check_health(self, node):
-        pass
+    assert plugin_manager.plugin_dirs.count(plugin_dir) == 1
+
+
+@patch('src.kafka_self_healing.plugins.os.path.exists', return_value=False)
+def test_load_plugins_nonexistent_directory(mock_exists, plugin_manager):
+    """Test loading plugins from nonexistent directory."""
+    plugin_manager.add_plugin_directory('/nonexistent/path')
+    
+    # Should not raise exception
+    plugin_manager.load_plugins()
+    mock_exists.assert_called_once_with('/nonexistent/path')
+    assert not plugin_manager.monitoring_plugins
+
+
+def test_load_valid_monitoring_plugin(plugin_manager):
+    """Test loading a valid monitoring plugin."""
+    _register_in_memory(plugin_manager, _TestMonitoringPlugin)
     
-    def supports_node_type(self, node_type):
-        return True
-'''
-        
-        plugin_file = Path(self.temp_dir) / 'error_cleanup_plugin.py'
-        plugin_file.write_text(plugin_content)
-        
-        self.plugin_manager.add_plugin_directory(self.temp_dir)
-        self.plugin_manager.load_plugins()
-        
-        # Cleanup should handle errors gracefully
-        self.plugin_manager.cleanup_plugins()
-        
-        # Verify error was logged
-        mock_logger.error.assert_called()
+    assert list(plugin_manager.monitoring_plugins) == ['_TestMonitoringPlugin']
+
+
+def test_load_valid_recovery_plugin(plugin_manager):
+    """Test loading a valid recovery plugin."""
+    _register_in_memory(plugin_manager, _TestRecoveryPlugin)
+    
+    assert list(plugin_manager.recovery_plugins) == ['_TestRecoveryPlugin']
+
+
+def test_load_valid_notification_plugin(plugin_manager):
+    """Test loading a valid notification plugin."""
+    _register_in_memory(plugin_manager, _TestNotificationPlugin)
+    
+    assert list(plugin_manager.notification_plugins) == ['_TestNotificationPlugin']
+
+
+@patch('src.kafka_self_healing.plugins.logger')
+def test_cleanup_plugins_noop_when_empty(mock_logger, plugin_manager):
+    """Test cleanup returns early when nothing was loaded."""
+    plugin_manager.cleanup_plugins()
+    
+    mock_logger.info.assert_not_called()
+
+
+@patch('src.kafka_self_healing.plugins.logger')
+def test_plugin_cleanup_with_errors(mock_logger, plugin_manager):
+    """Test plugin cleanup with errors."""
+    # A loaded plugin that raises during cleanup
+    failing_plugin = Mock()
+    failing_plugin.cleanup.side_effect = Exception("Cleanup error")
+    plugin_manager.monitoring_plugins['ErrorCleanupPlugin'] = failing_plugin
+    
+    # Cleanup should handle errors gracefully
+    plugin_manager.cleanup_plugins()
+    
+    # Verify error was logged and the plugin was still dropped
+    mock_logger.error.assert_called_once()
+    assert not plugin_manager.monitoring_plugins
+
+
+def test_get_plugin_errors(plugin_manager, tmp_path):
+    """Test plugin error retrieval."""
+    # Load invalid plugin to generate errors
+    (tmp_path / 'invalid_syntax_plugin.py').write_text(_BAD_SYNTAX_SRC)
+    plugin_manager.add_plugin_directory(str(tmp_path))
+    plugin_manager.load_plugins()
+    
+    errors = plugin_manager.get_plugin_errors()
+    assert errors
+    
+    # Ensure it returns a copy
+    errors['test'] = 'test'
+    original_errors = plugin_manager.get_plugin_errors()
+    assert 'test' not in original_errors
+
+
+@pytest.mark.parametrize(
+    "file_name, source, expect_errors",
+    [
+        ('failing_validation_plugin.py', _FAIL_VALIDATE_SRC, False),
+        ('failing_init_plugin.py', _FAIL_INIT_SRC, False),
+        ('invalid_syntax_plugin.py', _BAD_SYNTAX_SRC, True),
+    ],
+    ids=['validation_failure', 'initialization_failure', 'invalid_syntax'],
+)
+def test_load_plugin_rejected(tmp_path, file_name, source, expect_errors):
+    """Test plugins that fail validation, initialization or compilation are not loaded."""
+    (tmp_path / file_name).write_text(source)
+    
+    manager = PluginManager([str(tmp_path)])
+    manager.load_plugins()
+    
+    assert not manager.monitoring_plugins
+    # Only the syntax error surfaces as a load error; the others are just skipped
+    assert bool(manager.plugin_errors) == expect_errors
+
+
+def test_load_all_valid_plugins(loaded_manager):
+    """Test the file loader discovers one plugin of each kind from a directory."""
+    assert set(loaded_manager.loaded_modules) == {
+        Path(file_name).stem for file_name, _ in _PLUGIN_FILES.values()
+    }
+    assert list(loaded_manager.monitoring_plugins) == ['TestMonitoringPlugin']
+    assert list(loaded_manager.recovery_plugins) == ['TestRecoveryPlugin']
+    assert list(loaded_manager.notification_plugins) == ['TestNotificationPlugin']
+    assert loaded_manager.get_plugin_errors() == {}
+
+
+def test_get_plugin_methods(loaded_manager):
+    """Test plugin retrieval methods."""
+    # Test get all plugins
+    assert loaded_manager.get_monitoring_plugins() == [loaded_manager.monitoring_plugins['TestMonitoringPlugin']]
+    assert loaded_manager.get_recovery_plugins() == [loaded_manager.recovery_plugins['TestRecoveryPlugin']]
+    assert loaded_manager.get_notification_plugins() == [loaded_manager.notification_plugins['TestNotificationPlugin']]
+    
+    # Test get specific plugins
+    assert loaded_manager.get_monitoring_plugin('TestMonitoringPlugin') is not None
+    assert loaded_manager.get_recovery_plugin('TestRecoveryPlugin') is not None
+    assert loaded_manager.get_notification_plugin('TestNotificationPlugin') is not None
+    
+    # Test get nonexistent plugins
+    assert loaded_manager.get_monitoring_plugin('NonexistentPlugin') is None
+    assert loaded_manager.get_recovery_plugin('NonexistentPlugin') is None
+    assert loaded_manager.get_notification_plugin('NonexistentPlugin') is None
+
+
+def test_cleanup_plugins(fresh_loaded_manager):
+    """Test plugin cleanup."""
+    manager = fresh_loaded_manager
+    
+    # Verify plugins are loaded
+    assert list(manager.monitoring_plugins) == ['TestMonitoringPlugin']
+    assert list(manager.recovery_plugins) == ['TestRecoveryPlugin']
+    assert list(manager.notification_plugins) == ['TestNotificationPlugin']
+    
+    # Cleanup plugins
+    manager.cleanup_plugins()
+    
+    # Verify plugins are cleaned up
+    assert not manager.monitoring_plugins
+    assert not manager.recovery_plugins
+    assert not manager.notification_plugins
+    assert not manager.loaded_modules
+    assert not manager.plugin_errors
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
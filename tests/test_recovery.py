@@ -2,10 +2,12 @@
 Unit tests for the recovery engine system.
 """
 
+import copy
+import dataclasses
 import pytest
 import time
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 
 from src.kafka_self_healing.recovery import (
     RecoveryAction, RetryManager, RecoveryEngine, PluginRecoveryAction
@@ -14,12 +16,21 @@ from src.kafka_self_healing.models import NodeConfig, RecoveryResult, RetryPolic
 from src.kafka_self_healing.plugins import RecoveryPlugin
 from src.kafka_self_healing.exceptions import RecoveryError, ValidationError
 
+# Fixed timestamp for results and the frozen clock; nothing asserts on wall time
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Keep mock execution times and retry backoffs off the wall clock."""
+    monkeypatch.setattr('src.kafka_self_healing.recovery.time.sleep', lambda seconds: None)
+
 
 class MockRecoveryAction(RecoveryAction):
     """Mock recovery action for testing."""
     
     def __init__(self, action_type: str = "mock_action", should_succeed: bool = True, 
-                 execution_time: float = 0.1, config: dict = None):
+                 execution_time: float = 0.0, config: dict = None):
         super().__init__(action_type, config)
         self.should_succeed = should_succeed
         self.execution_time = execution_time
@@ -41,7 +52,7 @@ class MockRecoveryAction(RecoveryAction):
             exit_code=0 if self.should_succeed else 1,
             stdout="Mock success output" if self.should_succeed else "",
             stderr="" if self.should_succeed else "Mock error output",
-            execution_time=datetime.now(),
+            execution_time=_NOW,
             success=self.should_succeed
         )
     
@@ -53,6 +64,13 @@ class MockRecoveryAction(RecoveryAction):
         return node_type in ["kafka_broker", "zookeeper"]
 
 
+class _InvalidAction(MockRecoveryAction):
+    """Mock recovery action whose configuration never validates."""
+    
+    def validate_config(self) -> bool:
+        return False
+
+
 class MockRecoveryPlugin(RecoveryPlugin):
     """Mock recovery plugin for testing."""
     
@@ -74,7 +92,7 @@ class MockRecoveryPlugin(RecoveryPlugin):
             exit_code=0 if self.should_succeed else 1,
             stdout="Plugin success" if self.should_succeed else "",
             stderr="" if self.should_succeed else "Plugin error",
-            execution_time=datetime.now(),
+            execution_time=_NOW,
             success=self.should_succeed
         )
     
@@ -93,505 +111,511 @@ class MockRecoveryPlugin(RecoveryPlugin):
         self.cleanup_called = True
 
 
-class TestRetryManager:
-    """Test cases for RetryManager."""
+# Built once at import; fixtures hand out shallow copies with fresh call flags
+_ACTION_TEMPLATE = MockRecoveryAction("test_action")
+_PLUGIN_TEMPLATE = MockRecoveryPlugin("TestPlugin")
+
+
+@pytest.fixture
+def mock_action():
+    """Succeeding "test_action" recovery action."""
+    action = copy.copy(_ACTION_TEMPLATE)
+    action.execute_called = False
+    action.validate_called = False
+    return action
+
+
+@pytest.fixture
+def mock_plugin():
+    """Succeeding recovery plugin named "TestPlugin"."""
+    plugin = copy.copy(_PLUGIN_TEMPLATE)
+    plugin.execute_called = False
+    plugin.validate_called = False
+    plugin.initialize_called = False
+    plugin.cleanup_called = False
+    return plugin
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Pin datetime.now() inside the recovery module and return the pinned time."""
+    monkeypatch.setattr('src.kafka_self_healing.recovery.datetime', Mock(now=lambda: _NOW))
+    return _NOW
+
+
+@pytest.fixture(scope="module")
+def kafka_node_no_actions():
+    """Broker node with no recovery actions configured."""
+    return NodeConfig(node_id="test_node", node_type="kafka_broker", host="localhost", port=9092)
+
+
+@pytest.fixture(scope="module")
+def kafka_node():
+    """Broker node configured to use the "test_action" recovery action."""
+    return NodeConfig(
+        node_id="test_node",
+        node_type="kafka_broker",
+        host="localhost",
+        port=9092,
+        recovery_actions=["test_action"]
+    )
+
+
+@pytest.fixture(scope="module")
+def kafka_node2():
+    """Second broker node, on port 9093, using the "test_action" recovery action."""
+    return NodeConfig(
+        node_id="test_node2",
+        node_type="kafka_broker",
+        host="localhost",
+        port=9093,
+        recovery_actions=["test_action"]
+    )
+
+
+@pytest.fixture(scope="module")
+def default_policy():
+    """RetryPolicy with its defaults: three attempts, 30s initial delay."""
+    return RetryPolicy()
+
+
+@pytest.fixture(scope="module")
+def fast_retry_policy():
+    """Two attempts with a 5s delay before the retry."""
+    return RetryPolicy(max_attempts=2, initial_delay_seconds=5, backoff_multiplier=2.0)
+
+
+@pytest.fixture(scope="module")
+def five_attempt_policy():
+    """Five attempts with a 10s initial delay."""
+    return RetryPolicy(max_attempts=5, initial_delay_seconds=10)
+
+
+@pytest.fixture(scope="module")
+def capped_backoff_policy():
+    """2s initial delay doubling per attempt, capped at 16s."""
+    return RetryPolicy(initial_delay_seconds=2, backoff_multiplier=2.0, max_delay_seconds=16)
+
+
+@pytest.fixture(scope="module")
+def shared_engine():
+    """Engine with a registered "test_action", shared by tests that only read it."""
+    engine = RecoveryEngine()
+    engine.register_recovery_action("test_action", MockRecoveryAction("test_action"))
+    return engine
+
+
+@pytest.fixture
+def prewired_engine(shared_engine):
+    """shared_engine for tests that run recoveries; its run state is cleared afterwards."""
+    shared_engine.recovery_actions["test_action"].execute_called = False
+    yield shared_engine
+    shared_engine.reset_recovery_history()
+    shared_engine.active_recoveries.clear()
+
+
+@pytest.fixture
+def engine():
+    """Fresh engine for tests that register components or run recoveries."""
+    return RecoveryEngine()
+
+
+@pytest.fixture
+def failing_engine(kafka_node, fast_retry_policy):
+    """Engine whose only action always fails, allowing two attempts per node.
+    
+    Returns (engine, node, action, escalation_callback).
+    """
+    engine = RecoveryEngine(fast_retry_policy)
+    action = MockRecoveryAction("test_action", should_succeed=False)
+    engine.register_recovery_action("test_action", action)
+    callback = Mock()
+    engine.register_escalation_callback(callback)
+    return engine, dataclasses.replace(kafka_node, retry_policy=fast_retry_policy), action, callback
+
+
+def _assert_history(engine, **expected):
+    """Assert the number of recorded recovery results for each given node ID."""
+    got = {node_id: len(engine.get_recovery_history(node_id)) for node_id in expected}
+    assert got == expected
+
+
+def test_retry_manager_initialization(default_policy):
+    """Test retry manager initialization."""
+    manager = RetryManager(default_policy)
     
-    def test_retry_manager_initialization(self):
-        """Test retry manager initialization."""
-        retry_policy = RetryPolicy(max_attempts=3, initial_delay_seconds=10, 
-                                 backoff_multiplier=2.0, max_delay_seconds=60)
-        manager = RetryManager(retry_policy)
-        
-        assert manager.retry_policy == retry_policy
-        assert manager.attempt_count == 0
-        assert manager.last_attempt_time is None
-    
-    def test_should_retry_logic(self):
-        """Test retry logic."""
-        retry_policy = RetryPolicy(max_attempts=3)
-        manager = RetryManager(retry_policy)
-        
-        # Should retry for first 3 attempts
-        assert manager.should_retry() is True
-        manager.record_attempt()
-        
-        assert manager.should_retry() is True
-        manager.record_attempt()
-        
-        assert manager.should_retry() is True
+    assert (manager.retry_policy, manager.attempt_count, manager.last_attempt_time) == (
+        default_policy, 0, None
+    )
+
+
+@pytest.mark.parametrize("attempts, expected", [(0, True), (1, True), (2, True), (3, False)])
+def test_retry_manager_should_retry(default_policy, attempts, expected):
+    """Test retry is allowed until max_attempts (3) attempts have been recorded."""
+    manager = RetryManager(default_policy)
+    for _ in range(attempts):
         manager.record_attempt()
-        
-        # Should not retry after max attempts
-        assert manager.should_retry() is False
     
-    def test_exponential_backoff_delay(self):
-        """Test exponential backoff delay calculation."""
-        retry_policy = RetryPolicy(initial_delay_seconds=2, backoff_multiplier=2.0, max_delay_seconds=16)
-        manager = RetryManager(retry_policy)
-        
-        # First attempt has no delay
-        assert manager.get_next_delay() == 0
-        manager.record_attempt()
-        
-        # Second attempt: 2 seconds
-        assert manager.get_next_delay() == 2
-        manager.record_attempt()
-        
-        # Third attempt: 4 seconds
-        assert manager.get_next_delay() == 4
-        manager.record_attempt()
-        
-        # Fourth attempt: 8 seconds
-        assert manager.get_next_delay() == 8
+    assert manager.should_retry() is expected
+
+
+@pytest.mark.parametrize(
+    "attempts, expected",
+    [(0, 0), (1, 2), (2, 4), (3, 8), (4, 16), (5, 16)],
+)
+def test_retry_manager_exponential_backoff_delay(capped_backoff_policy, attempts, expected):
+    """Test exponential backoff delay, capped at max_delay_seconds."""
+    manager = RetryManager(capped_backoff_policy)
+    for _ in range(attempts):
         manager.record_attempt()
-        
-        # Fifth attempt: should be capped at max_delay_seconds (16)
-        assert manager.get_next_delay() == 16
     
-    def test_record_attempt(self):
-        """Test recording attempts."""
-        retry_policy = RetryPolicy()
-        manager = RetryManager(retry_policy)
-        
-        assert manager.attempt_count == 0
-        assert manager.last_attempt_time is None
-        
-        before_time = datetime.now()
-        manager.record_attempt()
-        after_time = datetime.now()
-        
-        assert manager.attempt_count == 1
-        assert before_time <= manager.last_attempt_time <= after_time
+    assert manager.get_next_delay() == expected
+
+
+def test_retry_manager_record_attempt(default_policy, frozen_clock):
+    """Test recording attempts."""
+    manager = RetryManager(default_policy)
     
-    def test_reset(self):
-        """Test resetting retry manager."""
-        retry_policy = RetryPolicy()
-        manager = RetryManager(retry_policy)
-        
-        manager.record_attempt()
-        manager.record_attempt()
-        
-        assert manager.attempt_count == 2
-        assert manager.last_attempt_time is not None
-        
-        manager.reset()
-        
-        assert manager.attempt_count == 0
-        assert manager.last_attempt_time is None
+    assert manager.attempt_count == 0
+    assert manager.last_attempt_time is None
     
-    def test_get_attempt_info(self):
-        """Test getting attempt information."""
-        retry_policy = RetryPolicy(max_attempts=5, initial_delay_seconds=10)
-        manager = RetryManager(retry_policy)
-        
-        info = manager.get_attempt_info()
-        assert info['attempt_count'] == 0
-        assert info['max_attempts'] == 5
-        assert info['last_attempt_time'] is None
-        assert info['next_delay_seconds'] == 0
-        
-        manager.record_attempt()
-        info = manager.get_attempt_info()
-        assert info['attempt_count'] == 1
-        assert info['next_delay_seconds'] == 10
+    manager.record_attempt()
+    
+    assert manager.attempt_count == 1
+    assert manager.last_attempt_time == frozen_clock
 
 
-class TestRecoveryAction:
-    """Test cases for RecoveryAction base class."""
+def test_retry_manager_reset(default_policy):
+    """Test resetting retry manager."""
+    manager = RetryManager(default_policy)
     
-    def test_recovery_action_initialization(self):
-        """Test recovery action initialization."""
-        config = {"param1": "value1"}
-        action = MockRecoveryAction("test_action", config=config)
-        
-        assert action.action_type == "test_action"
-        assert action.config == config
-        assert action.name == "MockRecoveryAction"
-    
-    def test_recovery_action_execution(self):
-        """Test recovery action execution."""
-        action = MockRecoveryAction("test_action", should_succeed=True)
-        node = NodeConfig(node_id="test_node", node_type="kafka_broker", host="localhost", port=9092)
-        
-        result = action.execute(node)
-        
-        assert action.execute_called is True
-        assert result.node_id == "test_node"
-        assert result.action_type == "test_action"
-        assert result.success is True
-        assert result.exit_code == 0
-    
-    def test_recovery_action_failure(self):
-        """Test recovery action failure."""
-        action = MockRecoveryAction("test_action", should_succeed=False)
-        node = NodeConfig(node_id="test_node", node_type="kafka_broker", host="localhost", port=9092)
-        
-        with pytest.raises(RecoveryError):
-            action.execute(node)
+    manager.record_attempt()
+    manager.record_attempt()
     
-    def test_recovery_action_validation(self):
-        """Test recovery action validation."""
-        action = MockRecoveryAction("test_action")
-        
-        assert action.validate_config() is True
-        assert action.validate_called is True
+    assert manager.attempt_count == 2
+    assert manager.last_attempt_time is not None
     
-    def test_recovery_action_node_type_support(self):
-        """Test recovery action node type support."""
-        action = MockRecoveryAction("test_action")
-        
-        assert action.supports_node_type("kafka_broker") is True
-        assert action.supports_node_type("zookeeper") is True
-        assert action.supports_node_type("unknown") is False
+    manager.reset()
     
-    def test_recovery_action_estimated_duration(self):
-        """Test recovery action estimated duration."""
-        action = MockRecoveryAction("test_action")
-        
-        assert action.get_estimated_duration() == 30  # Default value
+    assert manager.attempt_count == 0
+    assert manager.last_attempt_time is None
 
 
-class TestRecoveryEngine:
-    """Test cases for RecoveryEngine."""
+def test_retry_manager_get_attempt_info(five_attempt_policy, frozen_clock):
+    """Test getting attempt information."""
+    manager = RetryManager(five_attempt_policy)
+    
+    assert manager.get_attempt_info() == {
+        'attempt_count': 0,
+        'max_attempts': 5,
+        'last_attempt_time': None,
+        'next_delay_seconds': 0,
+    }
+    
+    manager.record_attempt()
+    assert manager.get_attempt_info() == {
+        'attempt_count': 1,
+        'max_attempts': 5,
+        'last_attempt_time': frozen_clock.isoformat(),
+        'next_delay_seconds': 10,
+    }
+
+
+def test_recovery_action_initialization():
+    """Test recovery action initialization."""
+    config = {"param1": "value1"}
+    action = MockRecoveryAction("test_action", config=config)
+    
+    assert action.action_type == "test_action"
+    assert action.config == config
+    assert action.name == "MockRecoveryAction"
+
+
+def test_recovery_action_execution(mock_action, kafka_node_no_actions):
+    """Test recovery action execution."""
+    action = mock_action
     
-    def test_recovery_engine_initialization(self):
-        """Test recovery engine initialization."""
-        retry_policy = RetryPolicy(max_attempts=5)
-        engine = RecoveryEngine(retry_policy)
-        
-        assert engine.default_retry_policy == retry_policy
-        assert len(engine.recovery_actions) == 0
-        assert len(engine.recovery_plugins) == 0
-        assert len(engine.recovery_history) == 0
-        assert len(engine.active_recoveries) == 0
-        assert len(engine.escalation_callbacks) == 0
-    
-    def test_register_recovery_action(self):
-        """Test registering recovery actions."""
-        engine = RecoveryEngine()
-        action = MockRecoveryAction("test_action")
-        
-        engine.register_recovery_action("test_action", action)
-        
-        assert "test_action" in engine.recovery_actions
-        assert engine.recovery_actions["test_action"] == action
-        assert action.validate_called is True
-    
-    def test_register_invalid_recovery_action(self):
-        """Test registering invalid recovery action."""
-        engine = RecoveryEngine()
-        action = MockRecoveryAction("test_action")
-        action.validate_config = Mock(return_value=False)
-        
-        with pytest.raises(ValidationError):
-            engine.register_recovery_action("test_action", action)
+    result = action.execute(kafka_node_no_actions)
     
-    def test_register_recovery_plugin(self):
-        """Test registering recovery plugins."""
-        engine = RecoveryEngine()
-        plugin = MockRecoveryPlugin("TestPlugin")
-        
-        engine.register_recovery_plugin(plugin)
-        
-        assert "TestPlugin" in engine.recovery_plugins
-        assert engine.recovery_plugins["TestPlugin"] == plugin
+    assert action.execute_called is True
+    assert result.node_id == "test_node"
+    assert result.action_type == "test_action"
+    assert result.success is True
+    assert result.exit_code == 0
+
+
+def test_recovery_action_failure(kafka_node_no_actions):
+    """Test recovery action failure."""
+    action = MockRecoveryAction("test_action", should_succeed=False)
     
-    def test_register_escalation_callback(self):
-        """Test registering escalation callbacks."""
-        engine = RecoveryEngine()
-        callback = Mock()
-        
-        engine.register_escalation_callback(callback)
-        
-        assert callback in engine.escalation_callbacks
+    with pytest.raises(RecoveryError):
+        action.execute(kafka_node_no_actions)
+
+
+def test_recovery_action_validation(mock_action):
+    """Test recovery action validation."""
+    action = mock_action
     
-    def test_successful_recovery_execution(self):
-        """Test successful recovery execution."""
-        engine = RecoveryEngine()
-        action = MockRecoveryAction("test_action", should_succeed=True)
-        engine.register_recovery_action("test_action", action)
-        
-        node = NodeConfig(
-            node_id="test_node", 
-            node_type="kafka_broker", 
-            host="localhost", 
-            port=9092,
-            recovery_actions=["test_action"]
-        )
-        
-        result = engine.execute_recovery(node, "connection_failure")
-        
-        assert result.success is True
-        assert result.node_id == "test_node"
-        assert action.execute_called is True
-        
-        # Check history was recorded
-        history = engine.get_recovery_history("test_node")
-        assert len(history) == 1
-        assert history[0] == result
-        
-        # Check active recovery was cleared
-        assert "test_node" not in engine.active_recoveries
-    
-    def test_failed_recovery_with_retries(self):
-        """Test failed recovery with retry attempts."""
-        retry_policy = RetryPolicy(max_attempts=2, initial_delay_seconds=0.1)
-        engine = RecoveryEngine(retry_policy)
-        action = MockRecoveryAction("test_action", should_succeed=False, execution_time=0.01)
-        engine.register_recovery_action("test_action", action)
-        
-        node = NodeConfig(
-            node_id="test_node", 
-            node_type="kafka_broker", 
-            host="localhost", 
-            port=9092,
-            recovery_actions=["test_action"],
-            retry_policy=retry_policy
-        )
-        
-        # First attempt should fail but not raise exception
-        result1 = engine.execute_recovery(node, "connection_failure")
-        assert result1.success is False
-        
-        # Second attempt should also fail but not raise exception
-        result2 = engine.execute_recovery(node, "connection_failure")
-        assert result2.success is False
-        
-        # Third attempt should raise RecoveryError (max attempts reached)
-        with pytest.raises(RecoveryError, match="Maximum retry attempts reached"):
-            engine.execute_recovery(node, "connection_failure")
-        
-        # Check history
-        history = engine.get_recovery_history("test_node")
-        assert len(history) == 2
-    
-    @patch('src.kafka_self_healing.recovery.time.sleep')
-    def test_retry_delay(self, mock_sleep):
-        """Test retry delay is applied."""
-        retry_policy = RetryPolicy(max_attempts=2, initial_delay_seconds=5, backoff_multiplier=2.0)
-        engine = RecoveryEngine(retry_policy)
-        action = MockRecoveryAction("test_action", should_succeed=False, execution_time=0)  # No execution time to avoid sleep
-        engine.register_recovery_action("test_action", action)
-        
-        node = NodeConfig(
-            node_id="test_node", 
-            node_type="kafka_broker", 
-            host="localhost", 
-            port=9092,
-            recovery_actions=["test_action"],
-            retry_policy=retry_policy
-        )
-        
-        # First attempt (no delay)
-        engine.execute_recovery(node, "connection_failure")
-        mock_sleep.assert_not_called()
-        
-        # Second attempt (should have delay)
-        engine.execute_recovery(node, "connection_failure")
-        mock_sleep.assert_called_once_with(5)
+    assert action.validate_config() is True
+    assert action.validate_called is True
+
+
+def test_recovery_action_node_type_support(mock_action):
+    """Test recovery action node type support."""
+    action = mock_action
     
-    def test_recovery_with_plugin(self):
-        """Test recovery using plugin."""
-        engine = RecoveryEngine()
-        plugin = MockRecoveryPlugin("TestPlugin", should_succeed=True)
-        engine.register_recovery_plugin(plugin)
-        
-        node = NodeConfig(
-            node_id="test_node", 
-            node_type="kafka_broker", 
-            host="localhost", 
-            port=9092
-        )
-        
-        result = engine.execute_recovery(node, "connection_failure")
-        
-        assert result.success is True
-        assert plugin.execute_called is True
-        assert result.action_type == "plugin_TestPlugin"
-    
-    def test_escalation_callback(self):
-        """Test escalation callback is called."""
-        retry_policy = RetryPolicy(max_attempts=1)
-        engine = RecoveryEngine(retry_policy)
-        action = MockRecoveryAction("test_action", should_succeed=False, execution_time=0.01)
-        engine.register_recovery_action("test_action", action)
-        
-        callback = Mock()
-        engine.register_escalation_callback(callback)
-        
-        node = NodeConfig(
-            node_id="test_node", 
-            node_type="kafka_broker", 
-            host="localhost", 
-            port=9092,
-            recovery_actions=["test_action"],
-            retry_policy=retry_policy
-        )
-        
-        # First attempt fails
-        engine.execute_recovery(node, "connection_failure")
-        
-        # Second attempt should trigger escalation
-        with pytest.raises(RecoveryError):
-            engine.execute_recovery(node, "connection_failure")
-        
-        callback.assert_called_once()
-        args = callback.call_args[0]
-        assert args[0] == "test_node"  # node_id
-        assert len(args[1]) == 1  # recovery history
-    
-    def test_no_suitable_recovery_action(self):
-        """Test when no suitable recovery action is found."""
-        engine = RecoveryEngine()
-        
-        node = NodeConfig(
-            node_id="test_node", 
-            node_type="kafka_broker", 
-            host="localhost", 
-            port=9092
-        )
-        
-        with pytest.raises(RecoveryError, match="No suitable recovery action found"):
-            engine.execute_recovery(node, "connection_failure")
-    
-    def test_get_active_recoveries(self):
-        """Test getting active recovery information."""
-        retry_policy = RetryPolicy(max_attempts=3)
-        engine = RecoveryEngine(retry_policy)
-        action = MockRecoveryAction("test_action", should_succeed=False, execution_time=0.01)
-        engine.register_recovery_action("test_action", action)
-        
-        node = NodeConfig(
-            node_id="test_node", 
-            node_type="kafka_broker", 
-            host="localhost", 
-            port=9092,
-            recovery_actions=["test_action"],
-            retry_policy=retry_policy
-        )
-        
-        # No active recoveries initially
-        active = engine.get_active_recoveries()
-        assert len(active) == 0
-        
-        # After failed attempt, should have active recovery
+    assert action.supports_node_type("kafka_broker") is True
+    assert action.supports_node_type("zookeeper") is True
+    assert action.supports_node_type("unknown") is False
+
+
+def test_recovery_action_estimated_duration(mock_action):
+    """Test recovery action estimated duration."""
+    action = mock_action
+    
+    assert action.get_estimated_duration() == 30  # Default value
+
+
+def test_recovery_engine_initialization(five_attempt_policy):
+    """Test recovery engine initialization."""
+    engine = RecoveryEngine(five_attempt_policy)
+    
+    assert engine.default_retry_policy == five_attempt_policy
+    assert len(engine.recovery_actions) == 0
+    assert len(engine.recovery_plugins) == 0
+    assert len(engine.recovery_history) == 0
+    assert len(engine.active_recoveries) == 0
+    assert len(engine.escalation_callbacks) == 0
+
+
+@pytest.mark.xdist_group(name="engine_shared")
+def test_register_recovery_action(shared_engine):
+    """Test registering recovery actions."""
+    assert list(shared_engine.recovery_actions) == ["test_action"]
+    action = shared_engine.recovery_actions["test_action"]
+    assert action.action_type == "test_action"
+    assert action.validate_called is True
+
+
+def test_register_invalid_recovery_action(engine):
+    """Test registering invalid recovery action."""
+    with pytest.raises(ValidationError):
+        engine.register_recovery_action("test_action", _InvalidAction("test_action"))
+    
+    assert not engine.recovery_actions
+
+
+def test_register_recovery_plugin(engine, mock_plugin):
+    """Test registering recovery plugins."""
+    plugin = mock_plugin
+    
+    engine.register_recovery_plugin(plugin)
+    
+    assert "TestPlugin" in engine.recovery_plugins
+    assert engine.recovery_plugins["TestPlugin"] == plugin
+
+
+def test_register_escalation_callback(engine):
+    """Test registering escalation callbacks."""
+    callback = Mock()
+    
+    engine.register_escalation_callback(callback)
+    
+    assert callback in engine.escalation_callbacks
+
+
+@pytest.mark.xdist_group(name="engine_shared")
+def test_successful_recovery_execution(prewired_engine, kafka_node):
+    """Test successful recovery execution."""
+    engine = prewired_engine
+    
+    result = engine.execute_recovery(kafka_node, "connection_failure")
+    
+    assert result.success is True
+    assert result.node_id == "test_node"
+    assert engine.recovery_actions["test_action"].execute_called is True
+    
+    # Check history was recorded
+    history = engine.get_recovery_history("test_node")
+    assert len(history) == 1
+    assert history[0] == result
+    
+    # Check active recovery was cleared
+    assert "test_node" not in engine.active_recoveries
+
+
+def test_failed_recovery_with_retries(failing_engine):
+    """Test failed recovery with retry attempts."""
+    engine, node, _, _ = failing_engine
+    
+    # First attempt should fail but not raise exception
+    result1 = engine.execute_recovery(node, "connection_failure")
+    assert result1.success is False
+    
+    # Second attempt should also fail but not raise exception
+    result2 = engine.execute_recovery(node, "connection_failure")
+    assert result2.success is False
+    
+    # Third attempt should raise RecoveryError (max attempts reached)
+    with pytest.raises(RecoveryError, match="Maximum retry attempts reached"):
         engine.execute_recovery(node, "connection_failure")
-        active = engine.get_active_recoveries()
-        assert "test_node" in active
-        assert active["test_node"]["attempt_count"] == 1
-        assert active["test_node"]["max_attempts"] == 3
-    
-    def test_cancel_recovery(self):
-        """Test cancelling active recovery."""
-        retry_policy = RetryPolicy(max_attempts=3)
-        engine = RecoveryEngine(retry_policy)
-        action = MockRecoveryAction("test_action", should_succeed=False, execution_time=0.01)
-        engine.register_recovery_action("test_action", action)
-        
-        node = NodeConfig(
-            node_id="test_node", 
-            node_type="kafka_broker", 
-            host="localhost", 
-            port=9092,
-            recovery_actions=["test_action"],
-            retry_policy=retry_policy
-        )
-        
-        # Start recovery
+    
+    # Check history
+    history = engine.get_recovery_history("test_node")
+    assert len(history) == 2
+
+
+def test_retry_delay(failing_engine, monkeypatch):
+    """Test retry delay is applied."""
+    engine, node, _, _ = failing_engine
+    sleeps = []
+    monkeypatch.setattr('src.kafka_self_healing.recovery.time.sleep', sleeps.append)
+    
+    # First attempt (no delay)
+    engine.execute_recovery(node, "connection_failure")
+    assert sleeps == []
+    
+    # Second attempt (should have delay)
+    engine.execute_recovery(node, "connection_failure")
+    assert sleeps == [5]
+
+
+def test_recovery_with_plugin(engine, mock_plugin, kafka_node_no_actions):
+    """Test recovery using plugin."""
+    plugin = mock_plugin
+    engine.register_recovery_plugin(plugin)
+    
+    result = engine.execute_recovery(kafka_node_no_actions, "connection_failure")
+    
+    assert result.success is True
+    assert plugin.execute_called is True
+    assert result.action_type == "plugin_TestPlugin"
+
+
+def test_escalation_callback(failing_engine):
+    """Test escalation callback is called."""
+    engine, node, _, callback = failing_engine
+    
+    # Both allowed attempts fail
+    engine.execute_recovery(node, "connection_failure")
+    engine.execute_recovery(node, "connection_failure")
+    callback.assert_not_called()
+    
+    # Next attempt should trigger escalation
+    with pytest.raises(RecoveryError):
         engine.execute_recovery(node, "connection_failure")
-        assert "test_node" in engine.active_recoveries
-        
-        # Cancel recovery
-        result = engine.cancel_recovery("test_node")
-        assert result is True
-        assert "test_node" not in engine.active_recoveries
-        
-        # Try to cancel non-existent recovery
-        result = engine.cancel_recovery("non_existent")
-        assert result is False
-    
-    def test_reset_recovery_history(self):
-        """Test resetting recovery history."""
-        engine = RecoveryEngine()
-        action = MockRecoveryAction("test_action", should_succeed=True)
-        engine.register_recovery_action("test_action", action)
-        
-        node1 = NodeConfig(
-            node_id="test_node1", 
-            node_type="kafka_broker", 
-            host="localhost", 
-            port=9092,
-            recovery_actions=["test_action"]
-        )
-        
-        node2 = NodeConfig(
-            node_id="test_node2", 
-            node_type="kafka_broker", 
-            host="localhost", 
-            port=9093,
-            recovery_actions=["test_action"]
-        )
-        
-        # Execute recoveries
-        engine.execute_recovery(node1, "connection_failure")
-        engine.execute_recovery(node2, "connection_failure")
-        
-        assert len(engine.get_recovery_history("test_node1")) == 1
-        assert len(engine.get_recovery_history("test_node2")) == 1
-        
-        # Reset specific node history
-        engine.reset_recovery_history("test_node1")
-        assert len(engine.get_recovery_history("test_node1")) == 0
-        assert len(engine.get_recovery_history("test_node2")) == 1
-        
-        # Reset all history
-        engine.reset_recovery_history()
-        assert len(engine.get_recovery_history("test_node1")) == 0
-        assert len(engine.get_recovery_history("test_node2")) == 0
+    
+    callback.assert_called_once()
+    args = callback.call_args[0]
+    assert args[0] == "test_node"  # node_id
+    assert len(args[1]) == 2  # recovery history
 
 
-class TestPluginRecoveryAction:
-    """Test cases for PluginRecoveryAction."""
+def test_no_suitable_recovery_action(engine, kafka_node_no_actions):
+    """Test when no suitable recovery action is found."""
     
-    def test_plugin_recovery_action_initialization(self):
-        """Test plugin recovery action initialization."""
-        plugin = MockRecoveryPlugin("TestPlugin")
-        action = PluginRecoveryAction(plugin, "connection_failure")
-        
-        assert action.action_type == "plugin_TestPlugin"
-        assert action.plugin == plugin
-        assert action.failure_type == "connection_failure"
-    
-    def test_plugin_recovery_action_execution(self):
-        """Test plugin recovery action execution."""
-        plugin = MockRecoveryPlugin("TestPlugin", should_succeed=True)
-        action = PluginRecoveryAction(plugin, "connection_failure")
-        
-        node = NodeConfig(node_id="test_node", node_type="kafka_broker", host="localhost", port=9092)
-        
-        result = action.execute(node)
-        
-        assert plugin.execute_called is True
-        assert result.success is True
-        assert result.action_type == "plugin_TestPlugin"
-    
-    def test_plugin_recovery_action_validation(self):
-        """Test plugin recovery action validation."""
-        plugin = MockRecoveryPlugin("TestPlugin")
-        action = PluginRecoveryAction(plugin, "connection_failure")
-        
-        assert action.validate_config() is True
-        assert plugin.validate_called is True
+    with pytest.raises(RecoveryError, match="No suitable recovery action found"):
+        engine.execute_recovery(kafka_node_no_actions, "connection_failure")
+
+
+def test_get_active_recoveries(failing_engine, frozen_clock):
+    """Test getting active recovery information."""
+    engine, node, _, _ = failing_engine
+    
+    # No active recoveries initially
+    assert engine.get_active_recoveries() == {}
+    
+    # After failed attempt, should have active recovery
+    engine.execute_recovery(node, "connection_failure")
+    assert engine.get_active_recoveries() == {
+        "test_node": {
+            'attempt_count': 1,
+            'max_attempts': 2,
+            'last_attempt_time': frozen_clock.isoformat(),
+            'next_delay_seconds': 5,
+        }
+    }
+
+
+def test_cancel_recovery(failing_engine):
+    """Test cancelling active recovery."""
+    engine, node, _, _ = failing_engine
+    
+    # Start recovery
+    engine.execute_recovery(node, "connection_failure")
+    assert "test_node" in engine.active_recoveries
+    
+    # Cancel recovery
+    result = engine.cancel_recovery("test_node")
+    assert result is True
+    assert "test_node" not in engine.active_recoveries
+    
+    # Try to cancel non-existent recovery
+    result = engine.cancel_recovery("non_existent")
+    assert result is False
+
+
+@pytest.mark.xdist_group(name="engine_shared")
+def test_reset_recovery_history(prewired_engine, kafka_node, kafka_node2):
+    """Test resetting recovery history."""
+    engine = prewired_engine
     
-    def test_plugin_recovery_action_node_type_support(self):
-        """Test plugin recovery action node type support."""
-        plugin = MockRecoveryPlugin("TestPlugin")
-        action = PluginRecoveryAction(plugin, "connection_failure")
-        
-        # Plugin actions assume they handle their own node type checking
-        assert action.supports_node_type("kafka_broker") is True
-        assert action.supports_node_type("zookeeper") is True
-        assert action.supports_node_type("unknown") is True
+    # Execute recoveries
+    engine.execute_recovery(kafka_node, "connection_failure")
+    engine.execute_recovery(kafka_node2, "connection_failure")
+    
+    _assert_history(engine, test_node=1, test_node2=1)
+    
+    # Reset specific node history
+    engine.reset_recovery_history("test_node")
+    _assert_history(engine, test_node=0, test_node2=1)
+    
+    # Reset all history
+    engine.reset_recovery_history()
+    _assert_history(engine, test_node=0, test_node2=0)
+
+
+def test_plugin_recovery_action_initialization(mock_plugin):
+    """Test plugin recovery action initialization."""
+    plugin = mock_plugin
+    action = PluginRecoveryAction(plugin, "connection_failure")
+    
+    assert action.action_type == "plugin_TestPlugin"
+    assert action.plugin == plugin
+    assert action.failure_type == "connection_failure"
+
+
+def test_plugin_recovery_action_execution(mock_plugin, kafka_node_no_actions):
+    """Test plugin recovery action execution."""
+    plugin = mock_plugin
+    action = PluginRecoveryAction(plugin, "connection_failure")
+    
+    
+    result = action.execute(kafka_node_no_actions)
+    
+    assert plugin.execute_called is True
+    assert result.success is True
+    assert result.action_type == "plugin_TestPlugin"
+
+
+def test_plugin_recovery_action_validation(mock_plugin):
+    """Test plugin recovery action validation."""
+    plugin = mock_plugin
+    action = PluginRecoveryAction(plugin, "connection_failure")
+    
+    assert action.validate_config() is True
+    assert plugin.validate_called is True
+
+
+def test_plugin_recovery_action_node_type_support(mock_plugin):
+    """Test plugin recovery action node type support."""
+    plugin = mock_plugin
+    action = PluginRecoveryAction(plugin, "connection_failure")
+    
+    # Plugin actions assume they handle their own node type checking
+    assert action.supports_node_type("kafka_broker") is True
+    assert action.supports_node_type("zookeeper") is True
+    assert action.supports_node_type("unknown") is True
 
 
 if __name__ == "__main__":
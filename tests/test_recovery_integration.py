@@ -16,11 +16,17 @@ from src.kafka_self_healing.models import NodeConfig, RecoveryResult, RetryPolic
 from src.kafka_self_healing.exceptions import RecoveryError, ValidationError
 
 
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Make retry backoffs and simulated execution delays free."""
+    monkeypatch.setattr('src.kafka_self_healing.recovery.time.sleep', lambda *_: None)
+
+
 class MockRecoveryAction(RecoveryAction):
     """Mock recovery action for integration testing."""
     
     def __init__(self, action_type: str = "mock_action", should_succeed: bool = True, 
-                 execution_delay: float = 0.01, fail_count: int = 0):
+                 execution_delay: float = 0.0, fail_count: int = 0):
         super().__init__(action_type)
         self.should_succeed = should_succeed
         self.execution_delay = execution_delay
@@ -32,7 +38,7 @@ class MockRecoveryAction(RecoveryAction):
         self.execute_called = True
         self.execution_count += 1
         
-        if self.execution_delay > 0:
+        if self.execution_delay:
             time.sleep(self.execution_delay)
         
         # Fail for the first fail_count attempts, then succeed